@@ -3,10 +3,22 @@ import sys
 import time
 import math
 import random
+import statistics
 import platform
+import re
 import json
 import datetime
+import sqlite3
+import hashlib
+import zlib
+import array
+import mmap
+import socket
+import socketserver
+import threading
+import asyncio
 import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from colorama import Fore, Style, init
 
 # Initialize colorama
@@ -28,50 +40,279 @@ BENCHMARK_GOOD = Fore.GREEN
 BENCHMARK_AVG = Fore.YELLOW
 BENCHMARK_BAD = Fore.RED
 
+# Untimed warmup runs and timed repetitions per benchmark (--warmup/--repeats)
+WARMUP_RUNS = 1
+REPEAT_RUNS = 5
+
+# Runs whose MAD exceeds this fraction of the median are flagged as noisy
+NOISE_THRESHOLD = 0.05
+
+# Regression detection: previous runs in the baseline, minimum history,
+# smallest drop worth reporting and the robust z-score it must exceed
+BASELINE_WINDOW = 10
+BASELINE_MIN_RUNS = 3
+REGRESSION_TOLERANCE = 0.05
+REGRESSION_Z = 3.0
+
+# Benchmarks run by 'sigma.benchmark compare' and its exit codes
+COMPARE_SUITE = ["cpu", "memory", "disk", "multicore"]
+EXIT_REGRESSION = 1
+EXIT_FAILED = 2
+EXIT_NO_BASELINE = 3
+
+# Results recorded during this process, by benchmark type
+RUN_RESULTS = {}
+
+# CPU kernel suite sizes
+SIEVE_LIMIT = 20000000
+SIEVE_SEGMENT = 256 * 1024
+VECTOR_SIZE = 4000000
+MATMUL_SIZE = 512
+HASH_BUFFER_SIZE = 64 * 1024 * 1024
+
+# Memory suite sizes: STREAM arrays well beyond the last-level cache,
+# pointer-chasing working sets from L1 to DRAM and allocation counts
+STREAM_SIZE = 10000000
+LATENCY_WORKING_SETS = [16 * 1024, 256 * 1024, 4 * 1024 * 1024, 32 * 1024 * 1024, 128 * 1024 * 1024]
+LATENCY_ACCESSES = 2000000
+CACHE_LINE = 64
+ALLOC_OBJECTS = 1000000
+ALLOC_BUFFER_SIZE = 1024 * 1024
+ALLOC_BUFFERS = 512
+
+# Disk suite: sequential file size and block, 4K random I/O per run at
+# each queue depth, and number of timed fsyncs
+DISK_SEQ_SIZE = 256 * 1024 * 1024
+DISK_SEQ_BLOCK = 1024 * 1024
+DISK_RANDOM_BLOCK = 4096
+DISK_RANDOM_OPS = 8192
+DISK_QUEUE_DEPTHS = [1, 4, 16, 32]
+DISK_FSYNC_OPS = 200
+
+# Scaling sweep: iterations per task and tasks per worker in each run,
+# so every run lasts long enough to amortize pool and dispatch overhead
+SCALING_TASK_SIZE = 1000000
+SCALING_TASKS_PER_WORKER = 4
+
+# Loopback network tests: message and chunk sizes, round trips timed,
+# bytes echoed per throughput run, parallel streams and connections per run
+NET_HOST = "127.0.0.1"
+NET_MESSAGE_SIZE = 64
+NET_BUFFER_SIZE = 64 * 1024
+NET_ROUND_TRIPS = 5000
+NET_STREAM_BYTES = 64 * 1024 * 1024
+NET_STREAMS = 4
+NET_CONNECTIONS = 500
+NET_BACKENDS = ["asyncio", "threaded"]
+
+# Rows per page of 'sigma.benchmark history'
+HISTORY_PAGE_SIZE = 20
+
+HISTORY_COLUMNS = ["timestamp", "type", "score", "stats", "system", "platform",
+                   "processor", "python_version", "host"]
+
 def get_sigmaos_root():
     """Returns the path to the SigmaOS root directory"""
     package_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.dirname(os.path.dirname(package_dir))
 
-def save_benchmark_result(benchmark_type, score):
-    """Save benchmark result to a history file"""
+def time_runs(task, label, warmup=None, repeats=None, setup=None):
+    """Run task() warmup times untimed, then time it repeatedly with perf_counter_ns
+
+    setup(), if given, runs untimed before every run (e.g. to drop caches).
+    """
+    warmup = WARMUP_RUNS if warmup is None else warmup
+    repeats = max(1, REPEAT_RUNS if repeats is None else repeats)
+    show_progress = sys.stdout.isatty()
+    result = None
+    
+    for i in range(warmup):
+        if show_progress:
+            sys.stdout.write(f"\r{label}: warmup {i + 1}/{warmup}   ")
+            sys.stdout.flush()
+        if setup:
+            setup()
+        result = task()
+    
+    times = []
+    for i in range(repeats):
+        # Progress is drawn between runs so it never lands inside the timed region
+        if show_progress:
+            sys.stdout.write(f"\r{label}: run {i + 1}/{repeats}      ")
+            sys.stdout.flush()
+        if setup:
+            setup()
+        start = time.perf_counter_ns()
+        result = task()
+        times.append((time.perf_counter_ns() - start) / 1e9)
+    
+    if show_progress:
+        sys.stdout.write("\r" + " " * 60 + "\r")
+    
+    return times, result
+
+def summarize(samples):
+    """Median, MAD, min/max and a 95% confidence interval of the median"""
+    ordered = sorted(samples)
+    n = len(ordered)
+    median = statistics.median(ordered)
+    mad = statistics.median(abs(x - median) for x in ordered)
+    
+    # Distribution-free interval from binomial order statistics
+    half_width = 1.96 * math.sqrt(n) / 2
+    low_rank = max(1, math.floor(n / 2 - half_width))
+    high_rank = min(n, math.ceil(1 + n / 2 + half_width))
+    
+    return {
+        "median": round(median, 2),
+        "mad": round(mad, 2),
+        "min": round(ordered[0], 2),
+        "max": round(ordered[-1], 2),
+        "ci_low": round(ordered[low_rank - 1], 2),
+        "ci_high": round(ordered[high_rank - 1], 2),
+        "noisy": median > 0 and mad / median > NOISE_THRESHOLD,
+        "samples": [round(x, 2) for x in samples],
+    }
+
+def print_summary(name, stats, unit=""):
+    """Print a benchmark score with its spread"""
+    median = stats["median"]
+    spread = stats["mad"] / median * 100 if median else 0
+    
+    print(f"{BENCHMARK_SCORE}{name}: {int(median):,}{unit} (median of {len(stats['samples'])} runs){Style.RESET_ALL}")
+    print(f"{BENCHMARK_INFO}MAD: ±{stats['mad']:,.0f} ({spread:.1f}%)  "
+          f"Min: {stats['min']:,.0f}  Max: {stats['max']:,.0f}  "
+          f"95% CI: [{stats['ci_low']:,.0f}, {stats['ci_high']:,.0f}]{Style.RESET_ALL}")
+    if stats["noisy"]:
+        print(f"{WARNING}Noisy result: spread above {NOISE_THRESHOLD:.0%}. Close other programs or use more --repeats.{Style.RESET_ALL}")
+
+def open_history_db():
+    """Open the benchmark history database, creating and migrating it if needed"""
     results_dir = os.path.join(get_sigmaos_root(), "benchmark_results")
     if not os.path.exists(results_dir):
         os.makedirs(results_dir)
     
-    results_file = os.path.join(results_dir, "benchmark_history.json")
+    # SQLite serializes concurrent writers, so overlapping runs can't corrupt history
+    db = sqlite3.connect(os.path.join(results_dir, "benchmark_history.db"), timeout=30)
+    db.row_factory = sqlite3.Row
+    db.executescript("""
+        CREATE TABLE IF NOT EXISTS benchmarks (
+            id INTEGER PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            type TEXT NOT NULL,
+            score INTEGER,
+            stats TEXT,
+            system TEXT,
+            platform TEXT,
+            processor TEXT,
+            python_version TEXT,
+            host TEXT
+        );
+        CREATE INDEX IF NOT EXISTS benchmarks_type_timestamp ON benchmarks (type, timestamp);
+        CREATE INDEX IF NOT EXISTS benchmarks_timestamp ON benchmarks (timestamp);
+    """)
+    
+    migrate_json_history(db, os.path.join(results_dir, "benchmark_history.json"))
+    return db
+
+def migrate_json_history(db, results_file):
+    """Import the old JSON history once, then move it out of the way"""
+    if not os.path.exists(results_file):
+        return
     
-    # Load existing results or create new
-    if os.path.exists(results_file):
+    # Hold the write lock so two runs starting together can't import twice
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        if not os.path.exists(results_file):
+            db.rollback()
+            return
+        
         try:
             with open(results_file, 'r') as f:
-                results = json.load(f)
+                benchmarks = json.load(f).get("benchmarks", [])
         except:
-            results = {"benchmarks": []}
-    else:
-        results = {"benchmarks": []}
+            benchmarks = []
+        
+        # The JSON history was kept per install and never recorded the host,
+        # so its runs belong to this one (baselines match on the host)
+        for record in benchmarks:
+            record.setdefault("host", platform.node())
+        
+        db.executemany(
+            f"INSERT INTO benchmarks ({', '.join(HISTORY_COLUMNS)}) VALUES ({', '.join('?' * len(HISTORY_COLUMNS))})",
+            [history_row(record) for record in benchmarks if record.get("timestamp") and record.get("type")])
+        os.replace(results_file, results_file + ".migrated")
+        db.commit()
+    except:
+        db.rollback()
+        raise
+
+def history_row(record):
+    """Column values for a benchmark record"""
+    return [json.dumps(record[column]) if column == "stats" and record.get(column) is not None
+            else record.get(column) for column in HISTORY_COLUMNS]
+
+def query_benchmark_history(benchmark_type=None, since=None, host=None, platform_name=None,
+                            processor=None, limit=None, offset=0, successful_only=False,
+                            system=None):
+    """Return (total matches, records newest first) for the given filters"""
+    conditions = ["score > 0"] if successful_only else []
+    params = []
+    for column, value in (("type", benchmark_type), ("host", host), ("system", system),
+                          ("platform", platform_name), ("processor", processor)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    if since is not None:
+        conditions.append("timestamp >= ?")
+        params.append(since)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    
+    db = open_history_db()
+    try:
+        total = db.execute(f"SELECT COUNT(*) FROM benchmarks{where}", params).fetchone()[0]
+        query = f"SELECT * FROM benchmarks{where} ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params = params + [limit, offset]
+        rows = db.execute(query, params).fetchall()
+    finally:
+        db.close()
     
-    # Add new result
-    results["benchmarks"].append({
+    records = []
+    for row in rows:
+        record = dict(row)
+        record["stats"] = json.loads(record["stats"]) if record["stats"] else None
+        records.append(record)
+    return total, records
+
+def save_benchmark_result(benchmark_type, score, stats=None):
+    """Append a benchmark result to the history database"""
+    record = {
         "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "type": benchmark_type,
         "score": score,
+        "stats": stats,
         "system": platform.system(),
         "platform": platform.platform(),
         "processor": platform.processor(),
-        "python_version": platform.python_version()
-    })
+        "python_version": platform.python_version(),
+        "host": platform.node()
+    }
+    RUN_RESULTS[benchmark_type] = record
     
-    # Save results
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=4)
+    db = open_history_db()
+    try:
+        with db:
+            db.execute(f"INSERT INTO benchmarks ({', '.join(HISTORY_COLUMNS)}) VALUES ({', '.join('?' * len(HISTORY_COLUMNS))})",
+                       history_row(record))
+    finally:
+        db.close()
 
 def cpu_benchmark(iterations=1000000):
     """Run a CPU benchmark"""
     print(f"{BENCHMARK_TITLE}Running CPU Benchmark... ({iterations:,} iterations){Style.RESET_ALL}")
     
-    start_time = time.time()
-    
     # Prime number calculation
     def is_prime(n):
         if n <= 1:
@@ -87,40 +328,23 @@ def cpu_benchmark(iterations=1000000):
             i += 6
         return True
     
-    count = 0
-    n = 2
-    
-    # Progress bar setup
-    update_interval = max(1, iterations // 20)
-    progress_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-    
-    for i in range(iterations):
-        if is_prime(n):
-            count += 1
-        n += 1
-        
-        # Update progress bar
-        if i % update_interval == 0:
-            progress = i / iterations
-            bar_length = 30
-            filled_length = int(bar_length * progress)
-            bar = '█' * filled_length + '░' * (bar_length - filled_length)
-            spinner = progress_chars[i // update_interval % len(progress_chars)]
-            sys.stdout.write(f"\r{spinner} Progress: [{bar}] {progress:.1%}")
-            sys.stdout.flush()
+    def count_primes():
+        count = 0
+        for n in range(2, iterations + 2):
+            if is_prime(n):
+                count += 1
+        return count
     
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    score = int(iterations / elapsed_time)
+    times, count = time_runs(count_primes, "CPU")
+    stats = summarize([iterations / t for t in times])
+    score = int(stats["median"])
     
-    # Clear progress line and print result
-    sys.stdout.write("\r" + " " * 60 + "\r")
-    print(f"{BENCHMARK_SCORE}CPU Score: {score:,}{Style.RESET_ALL}")
-    print(f"{BENCHMARK_TIME}Time: {elapsed_time:.2f} seconds{Style.RESET_ALL}")
+    print_summary("CPU Score", stats)
+    print(f"{BENCHMARK_TIME}Time: {statistics.median(times):.2f} seconds per run{Style.RESET_ALL}")
     print(f"{BENCHMARK_INFO}Found {count:,} prime numbers{Style.RESET_ALL}")
     
     # Save result
-    save_benchmark_result("cpu", score)
+    save_benchmark_result("cpu", score, stats)
     
     return score
 
@@ -129,34 +353,32 @@ def memory_benchmark(size=10000000):
     print(f"{BENCHMARK_TITLE}Running Memory Benchmark... ({size//1000000}M elements){Style.RESET_ALL}")
     
     try:
-        start_time = time.time()
-        
-        # Array allocation and random access
-        print(f"{BENCHMARK_INFO}Allocating memory...{Style.RESET_ALL}")
-        data = [i for i in range(size)]
-        
-        # Random memory access
-        print(f"{BENCHMARK_INFO}Testing random access...{Style.RESET_ALL}")
-        sum_value = 0
-        for _ in range(1000000):  # 1M random accesses
-            index = random.randint(0, size - 1)
-            sum_value += data[index]
+        # Random indices are generated up front so random.randint isn't timed
+        indices = [random.randint(0, size - 1) for _ in range(1000000)]  # 1M random accesses
         
-        # Sequential memory access
-        print(f"{BENCHMARK_INFO}Testing sequential access...{Style.RESET_ALL}")
-        sum_seq = 0
-        for i in range(0, size, 10):  # Step by 10 to not take too long
-            sum_seq += data[i]
+        def access_memory():
+            # Array allocation and random access
+            data = [i for i in range(size)]
+            
+            sum_value = 0
+            for index in indices:
+                sum_value += data[index]
+            
+            # Sequential memory access
+            sum_seq = 0
+            for i in range(0, size, 10):  # Step by 10 to not take too long
+                sum_seq += data[i]
+            return sum_value + sum_seq
         
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        score = int(size / elapsed_time)
+        times, _ = time_runs(access_memory, "Memory")
+        stats = summarize([size / t for t in times])
+        score = int(stats["median"])
         
-        print(f"{BENCHMARK_SCORE}Memory Score: {score:,}{Style.RESET_ALL}")
-        print(f"{BENCHMARK_TIME}Time: {elapsed_time:.2f} seconds{Style.RESET_ALL}")
+        print_summary("Memory Score", stats)
+        print(f"{BENCHMARK_TIME}Time: {statistics.median(times):.2f} seconds per run{Style.RESET_ALL}")
         
         # Save result
-        save_benchmark_result("memory", score)
+        save_benchmark_result("memory", score, stats)
         
         return score
     
@@ -171,54 +393,45 @@ def disk_benchmark(size=100000000, chunk_size=1000000):
     benchmark_file = os.path.join(get_sigmaos_root(), "benchmark_temp.dat")
     
     try:
-        # Write test
-        print(f"{BENCHMARK_INFO}Testing write speed...{Style.RESET_ALL}")
-        start_time = time.time()
+        # One pre-generated chunk, so os.urandom isn't part of the write time
+        chunk = os.urandom(chunk_size)
         
-        with open(benchmark_file, 'wb') as f:
-            for i in range(0, size, chunk_size):
-                f.write(os.urandom(chunk_size))  # Write random bytes
-                # Show progress
-                if i % (chunk_size * 10) == 0:
-                    sys.stdout.write(f"\rWritten: {i/1000000:.1f}M / {size/1000000:.1f}M")
-                    sys.stdout.flush()
+        def write_file():
+            with open(benchmark_file, 'wb') as f:
+                for _ in range(0, size, chunk_size):
+                    f.write(chunk)
         
-        write_time = time.time() - start_time
-        write_speed = size / write_time / 1000000  # MB/s
+        def read_file():
+            with open(benchmark_file, 'rb') as f:
+                while f.read(chunk_size):
+                    pass
         
-        sys.stdout.write("\r" + " " * 60 + "\r")
-        print(f"{BENCHMARK_INFO}Write Speed: {write_speed:.2f} MB/s{Style.RESET_ALL}")
+        # Write test
+        print(f"{BENCHMARK_INFO}Testing write speed...{Style.RESET_ALL}")
+        write_times, _ = time_runs(write_file, "Write")
+        write_speeds = [size / t / 1000000 for t in write_times]  # MB/s
+        print(f"{BENCHMARK_INFO}Write Speed: {statistics.median(write_speeds):.2f} MB/s{Style.RESET_ALL}")
         
         # Read test
         print(f"{BENCHMARK_INFO}Testing read speed...{Style.RESET_ALL}")
-        start_time = time.time()
-        
-        with open(benchmark_file, 'rb') as f:
-            for i in range(0, size, chunk_size):
-                data = f.read(chunk_size)
-                # Show progress
-                if i % (chunk_size * 10) == 0:
-                    sys.stdout.write(f"\rRead: {i/1000000:.1f}M / {size/1000000:.1f}M")
-                    sys.stdout.flush()
-        
-        read_time = time.time() - start_time
-        read_speed = size / read_time / 1000000  # MB/s
+        read_times, _ = time_runs(read_file, "Read")
+        read_speeds = [size / t / 1000000 for t in read_times]  # MB/s
+        print(f"{BENCHMARK_INFO}Read Speed: {statistics.median(read_speeds):.2f} MB/s{Style.RESET_ALL}")
         
-        sys.stdout.write("\r" + " " * 60 + "\r")
-        print(f"{BENCHMARK_INFO}Read Speed: {read_speed:.2f} MB/s{Style.RESET_ALL}")
-        
-        # Calculate score based on read and write speed
-        score = int((read_speed + write_speed) * 100)
+        # Calculate score based on read and write speed of each run
+        stats = summarize([(read_speed + write_speed) * 100
+                           for read_speed, write_speed in zip(read_speeds, write_speeds)])
+        score = int(stats["median"])
         
-        print(f"{BENCHMARK_SCORE}Disk Score: {score:,}{Style.RESET_ALL}")
-        print(f"{BENCHMARK_TIME}Total Time: {write_time + read_time:.2f} seconds{Style.RESET_ALL}")
+        print_summary("Disk Score", stats)
+        print(f"{BENCHMARK_TIME}Total Time: {sum(write_times) + sum(read_times):.2f} seconds{Style.RESET_ALL}")
         
         # Cleanup
         if os.path.exists(benchmark_file):
             os.remove(benchmark_file)
         
         # Save result
-        save_benchmark_result("disk", score)
+        save_benchmark_result("disk", score, stats)
         
         return score
     
@@ -246,24 +459,23 @@ def multicore_benchmark(processes=None, workload=1000000):
     print(f"{BENCHMARK_TITLE}Running Multi-Core Benchmark... ({processes} cores){Style.RESET_ALL}")
     
     try:
-        start_time = time.time()
-        
-        # Create a pool of worker processes
-        with multiprocessing.Pool(processes) as pool:
-            tasks = [workload] * processes
-            results = pool.map(parallel_task, tasks)
+        def run_pool():
+            # Create a pool of worker processes
+            with multiprocessing.Pool(processes) as pool:
+                tasks = [workload] * processes
+                return pool.map(parallel_task, tasks)
         
-        end_time = time.time()
-        elapsed_time = end_time - start_time
+        times, _ = time_runs(run_pool, "Multi-Core")
         
         # Score is calculations per second adjusted by core count
-        score = int((workload * processes) / elapsed_time)
+        stats = summarize([(workload * processes) / t for t in times])
+        score = int(stats["median"])
         
-        print(f"{BENCHMARK_SCORE}Multi-Core Score: {score:,}{Style.RESET_ALL}")
-        print(f"{BENCHMARK_TIME}Time: {elapsed_time:.2f} seconds{Style.RESET_ALL}")
+        print_summary("Multi-Core Score", stats)
+        print(f"{BENCHMARK_TIME}Time: {statistics.median(times):.2f} seconds per run{Style.RESET_ALL}")
         
         # Save result
-        save_benchmark_result("multicore", score)
+        save_benchmark_result("multicore", score, stats)
         
         return score
     
@@ -271,6 +483,649 @@ def multicore_benchmark(processes=None, workload=1000000):
         print(f"{ERROR}Multi-core benchmark failed: {e}{Style.RESET_ALL}")
         return 0
 
+def format_bytes(size):
+    """Format a power-of-two size like 256 KB"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:g} {unit}"
+        size /= 1024
+
+def format_rate(value, unit):
+    """Format a rate with an SI prefix, e.g. 1.23 Gops/s"""
+    for prefix in ("", "K", "M", "G", "T"):
+        if abs(value) < 1000 or prefix == "T":
+            return f"{value:.2f} {prefix}{unit}"
+        value /= 1000
+
+def segmented_sieve(limit, segment_size=SIEVE_SEGMENT):
+    """Count primes below limit, sieving one cache-sized segment at a time"""
+    root = math.isqrt(limit) + 1
+    base = bytearray([1]) * root
+    base[0:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(root) + 1):
+        if base[i]:
+            base[i * i::i] = bytes(len(range(i * i, root, i)))
+    primes = [i for i in range(2, root) if base[i]]
+    
+    count = len(primes)
+    for low in range(root, limit, segment_size):
+        high = min(low + segment_size, limit)
+        segment = bytearray([1]) * (high - low)
+        for p in primes:
+            if p * p >= high:
+                break
+            start = max(p * p, (low + p - 1) // p * p) - low
+            segment[start::p] = bytes(len(range(start, high - low, p)))
+        count += segment.count(1)
+    return count
+
+def get_cpu_kernels():
+    """Build the kernel suite as (name, unit, task, operations per run) tuples"""
+    kernels = [("sieve", "numbers/s", lambda: segmented_sieve(SIEVE_LIMIT), SIEVE_LIMIT)]
+    
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+        print(f"{WARNING}NumPy is not installed; skipping vectorized kernels.{Style.RESET_ALL}")
+    
+    if np is not None:
+        rng = np.random.default_rng(0)
+        ints = rng.integers(1, 1 << 30, VECTOR_SIZE, dtype=np.int64)
+        floats = rng.random(VECTOR_SIZE)
+        matrix_a = rng.random((MATMUL_SIZE, MATMUL_SIZE))
+        matrix_b = rng.random((MATMUL_SIZE, MATMUL_SIZE))
+        
+        # Per element: multiply, add, shift, xor, modulo and the final sum
+        def int_math():
+            return int((((ints * 3 + 7) ^ (ints >> 2)) % 1009).sum())
+        
+        # Per element: multiply, two adds, sqrt, divide and the final sum
+        def float_math():
+            return float((np.sqrt(floats * 1.5 + 0.5) / (floats + 1.0)).sum())
+        
+        kernels += [
+            ("int", "ops/s", int_math, VECTOR_SIZE * 6),
+            ("float", "FLOP/s", float_math, VECTOR_SIZE * 6),
+            ("matmul", "FLOP/s", lambda: matrix_a @ matrix_b, 2 * MATMUL_SIZE ** 3),
+        ]
+    
+    # Compressible, non-repeating data so zlib does real work
+    words = [b"sigma", b"kernel", b"bench", b"data", b"os", b"zlib", b"hash", b"cpu"]
+    generator = random.Random(0)
+    text = b" ".join(generator.choice(words) for _ in range(HASH_BUFFER_SIZE // 5))[:HASH_BUFFER_SIZE]
+    
+    kernels += [
+        ("sha256", "B/s", lambda: hashlib.sha256(text).digest(), len(text)),
+        ("blake2b", "B/s", lambda: hashlib.blake2b(text).digest(), len(text)),
+        ("zlib", "B/s", lambda: zlib.compress(text, 1), len(text)),
+        ("crc32", "B/s", lambda: zlib.crc32(text), len(text)),
+    ]
+    return kernels
+
+def cpu_kernel_benchmark():
+    """Run the CPU kernel suite and report throughput of each kernel"""
+    print(f"{BENCHMARK_TITLE}Running CPU Kernel Benchmark...{Style.RESET_ALL}")
+    print(f"{INFO}Preparing inputs...{Style.RESET_ALL}")
+    kernels = get_cpu_kernels()
+    
+    results = []
+    for name, unit, task, operations in kernels:
+        times, _ = time_runs(task, f"cpu_{name}")
+        stats = summarize([operations / t for t in times])
+        save_benchmark_result(f"cpu_{name}", int(stats["median"]), stats)
+        results.append((name, unit, stats))
+    
+    print(f"{COMMAND}{'Kernel':<10} {'Throughput':<18} {'Spread':<9}{Style.RESET_ALL}")
+    print("-" * 40)
+    for name, unit, stats in results:
+        spread = f"±{stats['mad'] / stats['median']:.1%}" if stats["median"] else "-"
+        color = WARNING if stats["noisy"] else BENCHMARK_SCORE
+        print(f"{BENCHMARK_INFO}{name:<10}{Style.RESET_ALL} "
+              f"{BENCHMARK_SCORE}{format_rate(stats['median'], unit):<18}{Style.RESET_ALL} "
+              f"{color}{spread}{' noisy' if stats['noisy'] else ''}{Style.RESET_ALL}")
+    
+    return results
+
+def get_stream_kernels():
+    """Build STREAM copy/scale/add/triad as (name, task, bytes moved per run)"""
+    try:
+        import numpy as np
+    except ImportError:
+        # array buffers can only copy at native speed; arithmetic would be interpreted
+        print(f"{WARNING}NumPy is not installed; only measuring copy bandwidth.{Style.RESET_ALL}")
+        a = array.array('d', bytes(8 * STREAM_SIZE))
+        c = array.array('d', bytes(8 * STREAM_SIZE))
+        
+        def copy():
+            c[:] = a
+        return [("copy", copy, 16 * STREAM_SIZE)]
+    
+    a = np.full(STREAM_SIZE, 1.0)
+    b = np.full(STREAM_SIZE, 2.0)
+    c = np.zeros(STREAM_SIZE)
+    scalar = 3.0
+    
+    def triad():
+        # a = b + scalar * c in two passes, reusing a as scratch
+        np.multiply(c, scalar, out=a)
+        np.add(a, b, out=a)
+    
+    # Bytes counted the STREAM way: reads plus writes of each array touched.
+    # NumPy can't fuse triad, so it is credited with the 40 bytes per element
+    # its two passes really move (c -> a, then a + b -> a), not STREAM's 24
+    return [
+        ("copy", lambda: np.copyto(c, a), 16 * STREAM_SIZE),
+        ("scale", lambda: np.multiply(c, scalar, out=b), 16 * STREAM_SIZE),
+        ("add", lambda: np.add(a, b, out=c), 24 * STREAM_SIZE),
+        ("triad_2pass", triad, 40 * STREAM_SIZE),
+    ]
+
+def build_pointer_chain(working_set):
+    """A random cyclic chain with one node per cache line, so every hop is a dependent miss"""
+    step = CACHE_LINE // 8
+    lines = max(2, working_set // CACHE_LINE)
+    order = list(range(lines))
+    random.Random(0).shuffle(order)
+    
+    chain = array.array('q', bytes(8 * lines * step))
+    for current, following in zip(order, order[1:] + order[:1]):
+        chain[current * step] = following * step
+    return chain, order[0] * step
+
+def chase_pointers(chain, start, accesses):
+    """Follow the chain; each load depends on the previous one"""
+    i = start
+    for _ in range(accesses):
+        i = chain[i]
+    return i
+
+def memory_suite_benchmark():
+    """Run STREAM bandwidth, pointer-chasing latency and allocation rate tests"""
+    print(f"{BENCHMARK_TITLE}Running Memory Suite...{Style.RESET_ALL}")
+    
+    # Bandwidth
+    print(f"{INFO}STREAM bandwidth ({STREAM_SIZE * 8 // 1000000} MB arrays){Style.RESET_ALL}")
+    for name, task, moved in get_stream_kernels():
+        times, _ = time_runs(task, f"mem_{name}")
+        stats = summarize([moved / t for t in times])
+        save_benchmark_result(f"mem_{name}", int(stats["median"]), stats)
+        print(f"{BENCHMARK_INFO}  {name:<12}{Style.RESET_ALL} {BENCHMARK_SCORE}{stats['median'] / 1e9:8.2f} GB/s{Style.RESET_ALL}"
+              f"{WARNING if stats['noisy'] else BENCHMARK_INFO}  ±{stats['mad'] / stats['median']:.1%}{Style.RESET_ALL}")
+    
+    # Latency: the interpreter adds a fixed cost per hop, so also show
+    # each working set relative to the smallest (L1-resident) one
+    print(f"{INFO}Pointer-chasing latency ({LATENCY_ACCESSES:,} dependent loads){Style.RESET_ALL}")
+    base_latency = None
+    for working_set in LATENCY_WORKING_SETS:
+        chain, start = build_pointer_chain(working_set)
+        times, _ = time_runs(lambda: chase_pointers(chain, start, LATENCY_ACCESSES), f"latency {format_bytes(working_set)}")
+        del chain
+        stats = summarize([LATENCY_ACCESSES / t for t in times])
+        save_benchmark_result(f"mem_lat_{format_bytes(working_set).replace(' ', '')}", int(stats["median"]), stats)
+        
+        latency = 1e9 / stats["median"]
+        if base_latency is None:
+            base_latency = latency
+        print(f"{BENCHMARK_INFO}  {format_bytes(working_set):<12}{Style.RESET_ALL} "
+              f"{BENCHMARK_SCORE}{latency:8.1f} ns/access{Style.RESET_ALL}"
+              f"{BENCHMARK_INFO}  ({latency - base_latency:+.1f} ns vs smallest){Style.RESET_ALL}")
+    
+    # Allocation rate
+    print(f"{INFO}Allocation rate{Style.RESET_ALL}")
+    times, _ = time_runs(lambda: [[i] for i in range(ALLOC_OBJECTS)], "mem_alloc_objects")
+    stats = summarize([ALLOC_OBJECTS / t for t in times])
+    save_benchmark_result("mem_alloc_objects", int(stats["median"]), stats)
+    print(f"{BENCHMARK_INFO}  {'objects':<12}{Style.RESET_ALL} {BENCHMARK_SCORE}{format_rate(stats['median'], 'objects/s')}{Style.RESET_ALL}")
+    
+    # The allocator recycles freed buffers, so this is allocation throughput
+    # rather than bandwidth; each buffer is still touched once per page
+    page_size = mmap.PAGESIZE
+    page_marks = b"\x01" * len(range(0, ALLOC_BUFFER_SIZE, page_size))
+    
+    def allocate_buffers():
+        for _ in range(ALLOC_BUFFERS):
+            buffer = bytearray(ALLOC_BUFFER_SIZE)
+            buffer[::page_size] = page_marks
+    
+    times, _ = time_runs(allocate_buffers, "mem_alloc_buffers")
+    stats = summarize([ALLOC_BUFFERS / t for t in times])
+    save_benchmark_result("mem_alloc_buffers", int(stats["median"]), stats)
+    print(f"{BENCHMARK_INFO}  {'buffers':<12}{Style.RESET_ALL} {BENCHMARK_SCORE}{format_rate(stats['median'], 'allocs/s')} "
+          f"({format_bytes(ALLOC_BUFFER_SIZE)} buffers){Style.RESET_ALL}")
+    
+    # Fresh anonymous mappings always need new pages from the kernel, so
+    # touching each page measures how fast memory can really be provided
+    def map_fresh_pages():
+        for _ in range(ALLOC_BUFFERS):
+            with mmap.mmap(-1, ALLOC_BUFFER_SIZE) as buffer:
+                buffer[::page_size] = page_marks
+    
+    times, _ = time_runs(map_fresh_pages, "mem_alloc_pages")
+    stats = summarize([ALLOC_BUFFERS * ALLOC_BUFFER_SIZE / t for t in times])
+    save_benchmark_result("mem_alloc_pages", int(stats["median"]), stats)
+    print(f"{BENCHMARK_INFO}  {'fresh pages':<12}{Style.RESET_ALL} {BENCHMARK_SCORE}{stats['median'] / 1e9:.2f} GB/s "
+          f"(new {format_bytes(page_size)} pages faulted in){Style.RESET_ALL}")
+
+def open_direct(path, flags):
+    """Open a file bypassing the page cache with O_DIRECT where supported; returns (fd, direct)"""
+    flags |= getattr(os, "O_BINARY", 0)
+    if hasattr(os, "O_DIRECT"):
+        try:
+            return os.open(path, flags | os.O_DIRECT, 0o644), True
+        except OSError:
+            # e.g. tmpfs doesn't support O_DIRECT
+            pass
+    return os.open(path, flags, 0o644), False
+
+def drop_file_cache(path):
+    """Flush a file and ask the kernel to evict its cached pages"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        os.fsync(fd)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+def disk_suite_benchmark(target=None, size=DISK_SEQ_SIZE):
+    """Run sequential, random 4K and fsync latency tests against a target directory"""
+    target = target or get_sigmaos_root()
+    if not os.path.isdir(target):
+        print(f"{ERROR}Target directory not found: {target}{Style.RESET_ALL}")
+        return
+    
+    benchmark_file = os.path.join(target, "benchmark_disk.dat")
+    fsync_file = os.path.join(target, "benchmark_fsync.dat")
+    size = max(DISK_SEQ_BLOCK, size // DISK_SEQ_BLOCK * DISK_SEQ_BLOCK)
+    
+    print(f"{BENCHMARK_TITLE}Running Disk Suite... ({format_bytes(size)} in {target}){Style.RESET_ALL}")
+    
+    # Page-aligned buffers (as O_DIRECT requires), filled once outside timing
+    buffer = mmap.mmap(-1, DISK_SEQ_BLOCK)
+    buffer.write(os.urandom(DISK_SEQ_BLOCK))
+    
+    try:
+        fd, direct = open_direct(benchmark_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        os.close(fd)
+        if direct:
+            print(f"{INFO}Using O_DIRECT to bypass the page cache.{Style.RESET_ALL}")
+        elif hasattr(os, "posix_fadvise"):
+            print(f"{INFO}O_DIRECT unavailable; evicting the page cache with fadvise before reads.{Style.RESET_ALL}")
+        else:
+            print(f"{WARNING}Cannot bypass the page cache here; read results may be inflated.{Style.RESET_ALL}")
+        
+        evict = None if direct else lambda: drop_file_cache(benchmark_file)
+        
+        # Sequential write, including the final fsync
+        def write_sequential():
+            fd, _ = open_direct(benchmark_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            try:
+                for _ in range(size // DISK_SEQ_BLOCK):
+                    os.write(fd, buffer)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        
+        def read_sequential():
+            fd, _ = open_direct(benchmark_file, os.O_RDONLY)
+            try:
+                while os.readv(fd, [buffer]):
+                    pass
+            finally:
+                os.close(fd)
+        
+        print(f"{INFO}Sequential throughput ({format_bytes(DISK_SEQ_BLOCK)} blocks){Style.RESET_ALL}")
+        for name, task in (("write", write_sequential), ("read", read_sequential)):
+            times, _ = time_runs(task, f"disk_seq_{name}", setup=evict if name == "read" else None)
+            stats = summarize([size / t for t in times])
+            save_benchmark_result(f"disk_seq_{name}", int(stats["median"]), stats)
+            print(f"{BENCHMARK_INFO}  {name:<6}{Style.RESET_ALL} {BENCHMARK_SCORE}{stats['median'] / 1e6:10.1f} MB/s{Style.RESET_ALL}"
+                  f"{WARNING if stats['noisy'] else BENCHMARK_INFO}  ±{stats['mad'] / stats['median']:.1%}{Style.RESET_ALL}")
+        
+        # Random 4K I/O, one thread per outstanding request
+        if not hasattr(os, "preadv"):
+            print(f"{WARNING}Random I/O test needs os.preadv; skipping.{Style.RESET_ALL}")
+        else:
+            print(f"{INFO}Random {format_bytes(DISK_RANDOM_BLOCK)} IOPS ({DISK_RANDOM_OPS:,} operations per run){Style.RESET_ALL}")
+            blocks = size // DISK_RANDOM_BLOCK
+            generator = random.Random(0)
+            offsets = [generator.randrange(blocks) * DISK_RANDOM_BLOCK for _ in range(DISK_RANDOM_OPS)]
+            
+            for name in ("read", "write"):
+                flags = os.O_RDONLY if name == "read" else os.O_WRONLY
+                for depth in DISK_QUEUE_DEPTHS:
+                    chunks = [offsets[i::depth] for i in range(depth)]
+                    buffers = [mmap.mmap(-1, DISK_RANDOM_BLOCK) for _ in range(depth)]
+                    fd, _ = open_direct(benchmark_file, flags)
+                    
+                    def worker(index, fd=fd, write=(name == "write")):
+                        io = os.pwritev if write else os.preadv
+                        block = [buffers[index]]
+                        for offset in chunks[index]:
+                            io(fd, block, offset)
+                    
+                    def run_depth(fd=fd):
+                        list(executor.map(worker, range(depth)))
+                        if name == "write":
+                            os.fsync(fd)
+                    
+                    try:
+                        with ThreadPoolExecutor(depth) as executor:
+                            times, _ = time_runs(run_depth, f"disk_rand{name}_qd{depth}", setup=evict)
+                    finally:
+                        os.close(fd)
+                    
+                    stats = summarize([DISK_RANDOM_OPS / t for t in times])
+                    save_benchmark_result(f"disk_rand{name}_qd{depth}", int(stats["median"]), stats)
+                    print(f"{BENCHMARK_INFO}  {name:<6} QD{depth:<3}{Style.RESET_ALL} "
+                          f"{BENCHMARK_SCORE}{stats['median']:10,.0f} IOPS{Style.RESET_ALL}"
+                          f"{WARNING if stats['noisy'] else BENCHMARK_INFO}  ±{stats['mad'] / stats['median']:.1%}{Style.RESET_ALL}")
+        
+        # fsync latency: small append followed by fsync, each timed on its own
+        print(f"{INFO}fsync latency ({DISK_FSYNC_OPS} x {format_bytes(DISK_RANDOM_BLOCK)} writes){Style.RESET_ALL}")
+        block = bytes(buffer[:DISK_RANDOM_BLOCK])
+        latencies = []
+        fd = os.open(fsync_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            for i in range(WARMUP_RUNS + DISK_FSYNC_OPS):
+                start = time.perf_counter_ns()
+                os.write(fd, block)
+                os.fsync(fd)
+                if i >= WARMUP_RUNS:
+                    latencies.append((time.perf_counter_ns() - start) / 1e6)
+        finally:
+            os.close(fd)
+        
+        ordered = sorted(latencies)
+        stats = summarize([1000 / latency for latency in latencies])
+        stats.update({f"p{p}_ms": round(percentile(ordered, p / 100), 3) for p in (50, 90, 99)})
+        save_benchmark_result("disk_fsync", int(stats["median"]), stats)
+        print(f"{BENCHMARK_INFO}  p50 {stats['p50_ms']:.2f} ms  p90 {stats['p90_ms']:.2f} ms  "
+              f"p99 {stats['p99_ms']:.2f} ms  max {ordered[-1]:.2f} ms{Style.RESET_ALL}")
+    
+    except Exception as e:
+        print(f"{ERROR}Disk suite failed: {e}{Style.RESET_ALL}")
+    finally:
+        buffer.close()
+        for path in (benchmark_file, fsync_file):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def get_scaling_points(max_workers):
+    """Worker counts to sweep: every count on small hosts, powers of two plus the
+    physical and logical core counts on larger ones"""
+    if max_workers <= 8:
+        return list(range(1, max_workers + 1))
+    
+    points = {max_workers}
+    count = 1
+    while count < max_workers:
+        points.add(count)
+        count *= 2
+    try:
+        import psutil
+        physical = psutil.cpu_count(logical=False)
+        if physical and physical < max_workers:
+            points.add(physical)
+    except ImportError:
+        pass
+    return sorted(points)
+
+def scaling_benchmark(max_workers=None, modes=("process", "thread")):
+    """Sweep worker counts and report throughput, speedup and parallel efficiency"""
+    max_workers = max_workers or multiprocessing.cpu_count()
+    points = get_scaling_points(max_workers)
+    
+    print(f"{BENCHMARK_TITLE}Running Scaling Benchmark... (1 to {max_workers} workers){Style.RESET_ALL}")
+    print(f"{INFO}Each worker runs {SCALING_TASKS_PER_WORKER} tasks of {SCALING_TASK_SIZE:,} iterations per run.{Style.RESET_ALL}")
+    
+    for mode in modes:
+        print(f"\n{HEADER}{mode.capitalize()} mode:{Style.RESET_ALL}")
+        print(f"{COMMAND}{'Workers':<8} {'Throughput':<18} {'Speedup':<9} {'Efficiency':<11}{Style.RESET_ALL}")
+        print("-" * 60)
+        
+        base = None
+        for workers in points:
+            tasks = [SCALING_TASK_SIZE] * (workers * SCALING_TASKS_PER_WORKER)
+            
+            # The pool is started before timing; warmup runs absorb worker startup
+            if mode == "process":
+                pool = multiprocessing.Pool(workers)
+                run = lambda: pool.map(parallel_task, tasks, chunksize=1)
+            else:
+                pool = ThreadPoolExecutor(workers)
+                run = lambda: list(pool.map(parallel_task, tasks))
+            
+            try:
+                times, _ = time_runs(run, f"{mode} x{workers}", warmup=max(1, WARMUP_RUNS))
+            finally:
+                if mode == "process":
+                    pool.close()
+                    pool.join()
+                else:
+                    pool.shutdown()
+            
+            stats = summarize([len(tasks) * SCALING_TASK_SIZE / t for t in times])
+            save_benchmark_result(f"scaling_{mode}_{workers}", int(stats["median"]), stats)
+            
+            throughput = stats["median"]
+            base = base or throughput
+            speedup = throughput / base
+            efficiency = speedup / workers
+            
+            if efficiency >= 0.8:
+                color = BENCHMARK_GOOD
+            elif efficiency >= 0.5:
+                color = BENCHMARK_AVG
+            else:
+                color = BENCHMARK_BAD
+            
+            bar = '█' * min(40, int(round(speedup * 40 / max_workers)))
+            print(f"{BENCHMARK_INFO}{workers:<8}{Style.RESET_ALL} "
+                  f"{BENCHMARK_SCORE}{format_rate(throughput, 'ops/s'):<18}{Style.RESET_ALL} "
+                  f"{BENCHMARK_INFO}{speedup:<9.2f}{Style.RESET_ALL} "
+                  f"{color}{efficiency:<11.0%}{Style.RESET_ALL} "
+                  f"{DESCRIPTION}{bar}{' noisy' if stats['noisy'] else ''}{Style.RESET_ALL}")
+    
+    if "thread" in modes and getattr(sys, "_is_gil_enabled", lambda: True)():
+        print(f"\n{INFO}Thread mode runs pure Python, so the GIL limits it to about one core.{Style.RESET_ALL}")
+
+class EchoTCPServer(socketserver.ThreadingTCPServer):
+    """Thread-per-connection TCP echo server"""
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+class TCPEchoHandler(socketserver.BaseRequestHandler):
+    """Echo everything received on a TCP connection"""
+    def handle(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        while True:
+            data = self.request.recv(NET_BUFFER_SIZE)
+            if not data:
+                break
+            self.request.sendall(data)
+
+class UDPEchoHandler(socketserver.BaseRequestHandler):
+    """Echo each datagram back to its sender"""
+    def handle(self):
+        data, sock = self.request
+        sock.sendto(data, self.client_address)
+
+class UDPEchoProtocol(asyncio.DatagramProtocol):
+    """Echo each datagram back to its sender"""
+    def connection_made(self, transport):
+        self.transport = transport
+    
+    def datagram_received(self, data, addr):
+        self.transport.sendto(data, addr)
+
+async def serve_echo_asyncio(ports):
+    """asyncio TCP and UDP echo servers; runs until the process is terminated"""
+    async def handle(reader, writer):
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                data = await reader.read(NET_BUFFER_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    server = await asyncio.start_server(handle, NET_HOST, 0, backlog=128)
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        UDPEchoProtocol, local_addr=(NET_HOST, 0))
+    ports.put((server.sockets[0].getsockname()[1], transport.get_extra_info("sockname")[1]))
+    await asyncio.Event().wait()
+
+def run_echo_server(backend, ports):
+    """Echo server process entry point; reports its (tcp, udp) ports on the queue"""
+    if backend == "asyncio":
+        asyncio.run(serve_echo_asyncio(ports))
+        return
+    
+    tcp_server = EchoTCPServer((NET_HOST, 0), TCPEchoHandler)
+    udp_server = socketserver.UDPServer((NET_HOST, 0), UDPEchoHandler)
+    threading.Thread(target=tcp_server.serve_forever, daemon=True).start()
+    ports.put((tcp_server.server_address[1], udp_server.server_address[1]))
+    udp_server.serve_forever()
+
+def recv_exact(sock, size):
+    """Receive exactly size bytes"""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed by echo server")
+        data += chunk
+    return data
+
+def measure_round_trips(sock, send, receive):
+    """Latency of each round trip in microseconds, after untimed warmup trips"""
+    message = b"x" * NET_MESSAGE_SIZE
+    latencies = []
+    lost = 0
+    
+    for i in range(NET_ROUND_TRIPS // 10 + NET_ROUND_TRIPS):
+        start = time.perf_counter_ns()
+        send(message)
+        try:
+            receive(len(message))
+        except socket.timeout:
+            lost += 1
+            continue
+        if i >= NET_ROUND_TRIPS // 10:
+            latencies.append((time.perf_counter_ns() - start) / 1000)
+    return latencies, lost
+
+def tcp_stream(port, total):
+    """Send total bytes through the echo server while a thread reads them back"""
+    payload = memoryview(bytes(NET_BUFFER_SIZE))
+    with socket.create_connection((NET_HOST, port)) as sock:
+        def read_back():
+            remaining = total
+            while remaining > 0:
+                chunk = sock.recv(min(NET_BUFFER_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+        
+        reader = threading.Thread(target=read_back)
+        reader.start()
+        sent = 0
+        while sent < total:
+            sent += sock.send(payload[:min(NET_BUFFER_SIZE, total - sent)])
+        reader.join()
+
+def print_latencies(name, latencies, lost=0):
+    """Print round-trip percentiles and return stats for history"""
+    ordered = sorted(latencies)
+    stats = summarize([1e6 / latency for latency in latencies])
+    stats.update({f"p{p}_us": round(percentile(ordered, p / 100), 1) for p in (50, 90, 99)})
+    stats["lost"] = lost
+    print(f"{BENCHMARK_INFO}  {name:<12}{Style.RESET_ALL} {BENCHMARK_SCORE}p50 {stats['p50_us']:.1f} µs  "
+          f"p90 {stats['p90_us']:.1f} µs  p99 {stats['p99_us']:.1f} µs  max {ordered[-1]:.1f} µs{Style.RESET_ALL}"
+          f"{WARNING + f'  ({lost} lost)' if lost else ''}{Style.RESET_ALL}")
+    return stats
+
+def network_benchmark(backends=None):
+    """Run loopback echo latency, throughput and connection rate tests per server backend"""
+    backends = backends or NET_BACKENDS
+    print(f"{BENCHMARK_TITLE}Running Network Benchmark... (loopback {NET_HOST}){Style.RESET_ALL}")
+    
+    for backend in backends:
+        print(f"\n{HEADER}{backend.capitalize()} echo server:{Style.RESET_ALL}")
+        
+        # The server gets its own process so it doesn't share the client's GIL
+        ports = multiprocessing.Queue()
+        server = multiprocessing.Process(target=run_echo_server, args=(backend, ports), daemon=True)
+        server.start()
+        
+        try:
+            tcp_port, udp_port = ports.get(timeout=10)
+            
+            # Round-trip latency
+            with socket.create_connection((NET_HOST, tcp_port)) as sock:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                latencies, _ = measure_round_trips(sock, sock.sendall, lambda size: recv_exact(sock, size))
+            stats = print_latencies("TCP RTT", latencies)
+            save_benchmark_result(f"net_{backend}_tcp_rtt", int(stats["median"]), stats)
+            
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.settimeout(1)
+                sock.connect((NET_HOST, udp_port))
+                latencies, lost = measure_round_trips(sock, sock.send, sock.recv)
+            if latencies:
+                stats = print_latencies("UDP RTT", latencies, lost)
+                save_benchmark_result(f"net_{backend}_udp_rtt", int(stats["median"]), stats)
+            
+            # Throughput with one and several concurrent streams
+            for streams in (1, NET_STREAMS):
+                def run_streams():
+                    threads = [threading.Thread(target=tcp_stream, args=(tcp_port, NET_STREAM_BYTES // streams))
+                               for _ in range(streams)]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                
+                times, _ = time_runs(run_streams, f"{streams} stream(s)")
+                stats = summarize([NET_STREAM_BYTES / t for t in times])
+                save_benchmark_result(f"net_{backend}_tcp_stream{streams}", int(stats["median"]), stats)
+                label = f"{streams} stream" + ("s" if streams > 1 else "")
+                print(f"{BENCHMARK_INFO}  {label:<12}{Style.RESET_ALL} {BENCHMARK_SCORE}{stats['median'] * 8 / 1e9:.2f} Gbit/s{Style.RESET_ALL}"
+                      f"{WARNING if stats['noisy'] else BENCHMARK_INFO}  ±{stats['mad'] / stats['median']:.1%}{Style.RESET_ALL}")
+            
+            # Connection setup, including the first round trip so the server must accept
+            def connect_many():
+                for _ in range(NET_CONNECTIONS):
+                    with socket.create_connection((NET_HOST, tcp_port)) as sock:
+                        sock.sendall(b"x")
+                        recv_exact(sock, 1)
+            
+            times, _ = time_runs(connect_many, "connections")
+            stats = summarize([NET_CONNECTIONS / t for t in times])
+            save_benchmark_result(f"net_{backend}_connect", int(stats["median"]), stats)
+            print(f"{BENCHMARK_INFO}  {'connections':<12}{Style.RESET_ALL} {BENCHMARK_SCORE}{stats['median']:,.0f} /s{Style.RESET_ALL}"
+                  f"{WARNING if stats['noisy'] else BENCHMARK_INFO}  ±{stats['mad'] / stats['median']:.1%}{Style.RESET_ALL}")
+        
+        except Exception as e:
+            print(f"{ERROR}Network benchmark failed: {e}{Style.RESET_ALL}")
+        finally:
+            server.terminate()
+            server.join()
+
 def run_full_benchmark():
     """Run all benchmarks and calculate a system score"""
     print(f"{HEADER}Starting SigmaOS Full System Benchmark{Style.RESET_ALL}")
@@ -326,39 +1181,166 @@ def run_full_benchmark():
     
     return overall_score
 
-def show_benchmark_history():
-    """Show history of benchmark results"""
-    results_dir = os.path.join(get_sigmaos_root(), "benchmark_results")
-    results_file = os.path.join(results_dir, "benchmark_history.json")
+def get_baseline(benchmark_type):
+    """Scores of the latest successful runs on this host, system and processor"""
+    # The full platform string includes the kernel release, which would
+    # drop the baseline on every image or kernel update
+    _, records = query_benchmark_history(benchmark_type, host=platform.node(), system=platform.system(),
+                                         processor=platform.processor(), limit=BASELINE_WINDOW,
+                                         successful_only=True)
+    return [record["score"] for record in records]
+
+def check_regression(baseline, record):
+    """Compare a fresh result against baseline scores; returns (status, change)"""
+    baseline_median = statistics.median(baseline)
+    stats = record.get("stats") or {"median": record["score"], "mad": 0}
+    current = stats["median"]
+    change = (current - baseline_median) / baseline_median
     
-    if not os.path.exists(results_file):
-        print(f"{WARNING}No benchmark history found.{Style.RESET_ALL}")
-        return
+    # Robust noise estimate: 1.4826 * MAD approximates one standard deviation
+    baseline_mad = statistics.median(abs(score - baseline_median) for score in baseline)
+    noise = 1.4826 * math.sqrt(baseline_mad ** 2 + stats["mad"] ** 2)
+    z = abs(current - baseline_median) / noise if noise else float("inf")
     
-    try:
-        with open(results_file, 'r') as f:
-            results = json.load(f)
+    if abs(change) < REGRESSION_TOLERANCE or z < REGRESSION_Z:
+        return "ok", change
+    return ("regression" if change < 0 else "improved"), change
+
+def compare_benchmarks(benchmark_types=None, allow_missing_baseline=False):
+    """Run benchmarks and compare them to the rolling baseline
+
+    Returns 0 if all is well, EXIT_REGRESSION if a metric regressed,
+    EXIT_FAILED if a benchmark could not produce a result and
+    EXIT_NO_BASELINE if a metric has too little history to compare against,
+    unless allow_missing_baseline is set.
+    """
+    benchmark_types = benchmark_types or COMPARE_SUITE
+    
+    # Baselines come from history recorded before this run
+    baselines = {benchmark_type: get_baseline(benchmark_type) for benchmark_type in benchmark_types}
+    
+    print(f"{HEADER}Comparing against the last {BASELINE_WINDOW} runs on this system{Style.RESET_ALL}")
+    print(f"{INFO}Host: {platform.node()} ({platform.system()}){Style.RESET_ALL}")
+    print(f"{INFO}Processor: {platform.processor() or 'Unknown'}{Style.RESET_ALL}")
+    print()
+    
+    runners = {
+        "cpu": cpu_benchmark,
+        "memory": memory_benchmark,
+        "disk": disk_benchmark,
+        "multicore": multicore_benchmark,
+    }
+    for benchmark_type in benchmark_types:
+        try:
+            runners[benchmark_type]()
+        except Exception as e:
+            print(f"{ERROR}{benchmark_type} benchmark failed: {e}{Style.RESET_ALL}")
+        print()
+    
+    print(f"{HEADER}Comparison:{Style.RESET_ALL}")
+    print(f"{COMMAND}{'Type':<10} {'Baseline':<14} {'Current':<14} {'Change':<9} {'Status'}{Style.RESET_ALL}")
+    print("-" * 60)
+    
+    regressed = False
+    failed = False
+    missing_baseline = False
+    for benchmark_type in benchmark_types:
+        baseline = baselines[benchmark_type]
+        record = RUN_RESULTS.get(benchmark_type)
+        
+        if not record or not record["score"]:
+            failed = True
+            print(f"{BENCHMARK_INFO}{benchmark_type:<10}{Style.RESET_ALL} {ERROR}benchmark failed{Style.RESET_ALL}")
+            continue
+        if len(baseline) < BASELINE_MIN_RUNS:
+            missing_baseline = True
+            print(f"{BENCHMARK_INFO}{benchmark_type:<10} {'-':<14} {record['score']:<14,} {'-':<9}{Style.RESET_ALL} "
+                  f"{WARNING}not enough history ({len(baseline)}/{BASELINE_MIN_RUNS} runs){Style.RESET_ALL}")
+            continue
+        
+        status, change = check_regression(baseline, record)
+        if status == "regression":
+            regressed = True
+            color = BENCHMARK_BAD
+        elif status == "improved":
+            color = BENCHMARK_GOOD
+        else:
+            color = BENCHMARK_INFO
         
-        benchmarks = results.get("benchmarks", [])
+        print(f"{BENCHMARK_INFO}{benchmark_type:<10} {int(statistics.median(baseline)):<14,} "
+              f"{record['score']:<14,} {change:<+9.1%}{Style.RESET_ALL} {color}{status}{Style.RESET_ALL}")
+    
+    print()
+    if failed:
+        # A gate must not pass when it couldn't measure everything
+        print(f"{ERROR}Some benchmarks failed; the comparison is incomplete.{Style.RESET_ALL}")
+        return EXIT_FAILED
+    if regressed:
+        print(f"{ERROR}Performance regression detected.{Style.RESET_ALL}")
+        return EXIT_REGRESSION
+    if missing_baseline and not allow_missing_baseline:
+        print(f"{ERROR}Some metrics have no baseline on this system; nothing was compared for them.{Style.RESET_ALL}")
+        print(f"{INFO}Record more runs, or pass --allow-missing-baseline to accept this.{Style.RESET_ALL}")
+        return EXIT_NO_BASELINE
+    print(f"{SUCCESS}No significant regressions.{Style.RESET_ALL}")
+    return 0
+
+def parse_since(text):
+    """Parse YYYY-MM-DD[ HH:MM[:SS]] or a relative age like 7d or 12h into a timestamp"""
+    match = re.fullmatch(r"(\d+)([dh])", text.strip().lower())
+    if match:
+        unit = "days" if match.group(2) == "d" else "hours"
+        moment = datetime.datetime.now() - datetime.timedelta(**{unit: int(match.group(1))})
+        return moment.strftime("%Y-%m-%d %H:%M:%S")
+    
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(text.strip(), fmt).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+    return None
+
+def show_benchmark_history(benchmark_type=None, since=None, host=None, page=1, page_size=HISTORY_PAGE_SIZE):
+    """Show one page of benchmark history, newest first"""
+    try:
+        total, benchmarks = query_benchmark_history(benchmark_type, since, host,
+                                                    limit=page_size, offset=(page - 1) * page_size)
         
         if not benchmarks:
-            print(f"{WARNING}No benchmark history found.{Style.RESET_ALL}")
+            if total:
+                print(f"{WARNING}Page {page} is empty; history has {math.ceil(total / page_size)} pages.{Style.RESET_ALL}")
+            else:
+                print(f"{WARNING}No benchmark history found.{Style.RESET_ALL}")
             return
         
         print(f"{HEADER}Benchmark History:{Style.RESET_ALL}")
-        print(f"{COMMAND}{'Timestamp':<20} {'Type':<10} {'Score':<12} {'System'}{Style.RESET_ALL}")
-        print("-" * 80)
+        print(f"{COMMAND}{'Timestamp':<20} {'Type':<26} {'Score':<16} {'Spread':<9} {'Host':<16} {'System'}{Style.RESET_ALL}")
+        print("-" * 94)
         
-        for benchmark in reversed(benchmarks):
+        for benchmark in benchmarks:
             timestamp = benchmark.get("timestamp", "Unknown")
             btype = benchmark.get("type", "Unknown")
-            score = benchmark.get("score", 0)
-            system = benchmark.get("system", "Unknown")
+            score = benchmark.get("score") or 0
+            system = benchmark.get("system") or "Unknown"
+            host_name = benchmark.get("host") or "-"
+            
+            # Older records hold a single score without a distribution
+            stats = benchmark.get("stats")
+            if stats and stats.get("median"):
+                spread = f"±{stats['mad'] / stats['median']:.1%}" + ("!" if stats.get("noisy") else "")
+            else:
+                spread = "-"
             
             print(f"{BENCHMARK_TIME}{timestamp:<20}{Style.RESET_ALL} "
-                  f"{BENCHMARK_INFO}{btype:<10}{Style.RESET_ALL} "
-                  f"{BENCHMARK_SCORE}{score:<12,}{Style.RESET_ALL} "
-                  f"{DESCRIPTION}{system}{Style.RESET_ALL}")
+                  f"{BENCHMARK_INFO}{btype:<26}{Style.RESET_ALL} "
+                  f"{BENCHMARK_SCORE}{score:<16,}{Style.RESET_ALL} "
+                  f"{BENCHMARK_INFO}{spread:<9}{Style.RESET_ALL} "
+                  f"{DESCRIPTION}{host_name:<16} {system}{Style.RESET_ALL}")
+        
+        pages = math.ceil(total / page_size)
+        print(f"\n{INFO}Page {page} of {pages} ({total} results){Style.RESET_ALL}")
+        if page < pages:
+            print(f"{INFO}Use 'sigma.benchmark history --page {page + 1}' for older results.{Style.RESET_ALL}")
         
     except Exception as e:
         print(f"{ERROR}Error loading benchmark history: {e}{Style.RESET_ALL}")
@@ -368,16 +1350,44 @@ def show_help():
     print(f"\n{HEADER}System Benchmark Commands:{Style.RESET_ALL}")
     print(f"{COMMAND}  sigma.benchmark{DESCRIPTION} - Run full system benchmark")
     print(f"{COMMAND}  sigma.benchmark cpu{DESCRIPTION} - Run CPU benchmark")
+    print(f"{COMMAND}  sigma.benchmark kernels{DESCRIPTION} - Run CPU kernel suite (sieve, NumPy math, matmul, hashing)")
     print(f"{COMMAND}  sigma.benchmark memory{DESCRIPTION} - Run memory benchmark")
+    print(f"{COMMAND}  sigma.benchmark memsuite{DESCRIPTION} - Run memory bandwidth, latency and allocation tests")
     print(f"{COMMAND}  sigma.benchmark disk{DESCRIPTION} - Run disk benchmark")
+    print(f"{COMMAND}  sigma.benchmark disksuite [--path dir] [--size MB]{DESCRIPTION} - Run sequential, random IOPS and fsync latency tests")
     print(f"{COMMAND}  sigma.benchmark multicore{DESCRIPTION} - Run multi-core benchmark")
+    print(f"{COMMAND}  sigma.benchmark net [asyncio|threaded]{DESCRIPTION} - Run loopback TCP/UDP latency, throughput and connection tests")
+    print(f"{COMMAND}  sigma.benchmark scaling [max] [process|thread]{DESCRIPTION} - Sweep worker counts and show the speedup curve")
     print(f"{COMMAND}  sigma.benchmark history{DESCRIPTION} - Show benchmark history")
+    print(f"{COMMAND}  sigma.benchmark history [--type t] [--since date|7d] [--host h] [--page n]{DESCRIPTION} - Filter and page history")
+    print(f"{COMMAND}  sigma.benchmark compare [types...] [--allow-missing-baseline]{DESCRIPTION} - Run benchmarks and fail on regressions against history")
+    print(f"\n{HEADER}Options:{Style.RESET_ALL}")
+    print(f"{COMMAND}  --warmup <n>{DESCRIPTION} - Untimed warmup runs per benchmark (default {WARMUP_RUNS})")
+    print(f"{COMMAND}  --repeats <n>{DESCRIPTION} - Timed runs per benchmark (default {REPEAT_RUNS})")
     print()
 
 def main():
     """Main entry point for benchmark module"""
+    global WARMUP_RUNS, REPEAT_RUNS
     args = sys.argv[1:] if len(sys.argv) > 1 else []
     
+    # Global options may appear anywhere
+    for option in ("--warmup", "--repeats"):
+        if option in args:
+            index = args.index(option)
+            try:
+                value = int(args[index + 1])
+                if value < 0 or (option == "--repeats" and value < 1):
+                    raise ValueError
+            except (IndexError, ValueError):
+                print(f"{ERROR}Invalid value for {option}{Style.RESET_ALL}")
+                return
+            if option == "--warmup":
+                WARMUP_RUNS = value
+            else:
+                REPEAT_RUNS = value
+            args = args[:index] + args[index + 2:]
+    
     if not args:
         # Default behavior: run full benchmark
         run_full_benchmark()
@@ -389,16 +1399,92 @@ def main():
         show_help()
     elif command == "cpu":
         cpu_benchmark()
+    elif command == "kernels":
+        cpu_kernel_benchmark()
     elif command == "memory":
         memory_benchmark()
+    elif command == "memsuite":
+        memory_suite_benchmark()
     elif command == "disk":
         disk_benchmark()
+    elif command == "disksuite":
+        target = None
+        size = DISK_SEQ_SIZE
+        options = args[1:]
+        while options:
+            option = options.pop(0)
+            if option == "--path" and options:
+                target = options.pop(0)
+            elif option == "--size" and options:
+                try:
+                    size = int(float(options.pop(0)) * 1024 * 1024)
+                except ValueError:
+                    print(f"{ERROR}Invalid size in MB{Style.RESET_ALL}")
+                    return
+            else:
+                print(f"{ERROR}Invalid disksuite option: {option}{Style.RESET_ALL}")
+                return
+        disk_suite_benchmark(target, size)
     elif command == "multicore":
         multicore_benchmark()
+    elif command == "net":
+        backends = [arg.lower() for arg in args[1:]]
+        unknown = [backend for backend in backends if backend not in NET_BACKENDS]
+        if unknown:
+            print(f"{ERROR}Unknown backend: {unknown[0]}. Choose from {', '.join(NET_BACKENDS)}.{Style.RESET_ALL}")
+            return
+        network_benchmark(backends)
+    elif command == "scaling":
+        max_workers = None
+        modes = ("process", "thread")
+        for arg in args[1:]:
+            if arg.lower() in ("process", "thread"):
+                modes = (arg.lower(),)
+            else:
+                try:
+                    max_workers = int(arg)
+                    if max_workers < 1:
+                        raise ValueError
+                except ValueError:
+                    print(f"{ERROR}Invalid scaling option: {arg}{Style.RESET_ALL}")
+                    return
+        scaling_benchmark(max_workers, modes)
     elif command == "full":
         run_full_benchmark()
     elif command == "history":
-        show_benchmark_history()
+        filters = {}
+        options = args[1:]
+        while options:
+            option = options.pop(0)
+            if option not in ("--type", "--since", "--host", "--page", "--limit") or not options:
+                print(f"{ERROR}Invalid history option: {option}{Style.RESET_ALL}")
+                return
+            value = options.pop(0)
+            if option == "--since":
+                filters["since"] = parse_since(value)
+                if filters["since"] is None:
+                    print(f"{ERROR}Invalid date: {value}. Use YYYY-MM-DD or e.g. 7d.{Style.RESET_ALL}")
+                    return
+            elif option in ("--page", "--limit"):
+                try:
+                    number = int(value)
+                    if number < 1:
+                        raise ValueError
+                except ValueError:
+                    print(f"{ERROR}Invalid number: {value}{Style.RESET_ALL}")
+                    return
+                filters["page" if option == "--page" else "page_size"] = number
+            else:
+                filters["benchmark_type" if option == "--type" else "host"] = value.lower() if option == "--type" else value
+        show_benchmark_history(**filters)
+    elif command == "compare":
+        allow_missing_baseline = "--allow-missing-baseline" in args
+        benchmark_types = [arg.lower() for arg in args[1:] if arg != "--allow-missing-baseline"]
+        unknown = [arg for arg in benchmark_types if arg not in COMPARE_SUITE]
+        if unknown:
+            print(f"{ERROR}Unknown benchmark type: {unknown[0]}. Choose from {', '.join(COMPARE_SUITE)}.{Style.RESET_ALL}")
+            sys.exit(EXIT_FAILED)
+        sys.exit(compare_benchmarks(benchmark_types, allow_missing_baseline))
     else:
         print(f"{ERROR}Unknown command: {command}{Style.RESET_ALL}")
         show_help()
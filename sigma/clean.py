@@ -1,9 +1,19 @@
 import os
 import sys
 import shutil
-import glob
 import time
 import datetime
+import fnmatch
+import heapq
+import gzip
+import zlib
+import re
+import json
+import threading
+import hashlib
+import signal
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from colorama import Fore, Style, init
 
 # Initialize colorama
@@ -18,6 +28,25 @@ HEADER = Fore.YELLOW
 COMMAND = Fore.GREEN
 DESCRIPTION = Fore.WHITE
 
+# Plain and compressed (sigma.viewlogs compress) log files
+LOG_EXTENSIONS = (".log", ".log.gz", ".log.bz2", ".log.xz", ".log.zst")
+LOG_PATTERNS = ["*" + ext for ext in LOG_EXTENSIONS]
+
+# Temporary files in the SigmaOS root
+TEMP_PATTERNS = ["*.tmp", "*.temp", "temp*.*", "tmp*.*", "*.~*", "*.__*"]
+
+# Cache entries inside each package directory
+CACHE_PATTERNS = ["__pycache__", "*.pyc", "cache", ".cache", "tmp", "temp"]
+
+# Threads used to size directory trees and to delete files
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+DELETE_WORKERS = 8
+DELETE_BATCH = 256
+
+# Entries collected by 'simulate --plan <file>', None when not recording
+PLAN_ENTRIES = None
+PLAN_VERSION = 1
+
 def get_sigmaos_root():
     """Returns the path to the SigmaOS root directory"""
     package_dir = os.path.dirname(os.path.abspath(__file__))
@@ -33,6 +62,252 @@ def format_bytes(size):
         n += 1
     return f"{size:.2f} {power_labels[n]}"
 
+def scan_dir(directory, patterns):
+    """List entries of a directory matching glob-style patterns, one stat each"""
+    entries = []
+    
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                for pattern in patterns:
+                    # Like glob, wildcards don't match hidden names
+                    if entry.name.startswith(".") and not pattern.startswith("."):
+                        continue
+                    if fnmatch.fnmatch(entry.name, pattern):
+                        break
+                else:
+                    continue
+                
+                try:
+                    st = entry.stat()
+                    entries.append({
+                        "path": entry.path,
+                        "name": entry.name,
+                        "size": st.st_size,
+                        "mtime": st.st_mtime,
+                        "inode": st.st_ino,
+                        "dev": st.st_dev,
+                        "is_dir": entry.is_dir(),
+                    })
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    
+    entries.sort(key=lambda entry: entry["path"])
+    return entries
+
+def get_tree_size(path):
+    """Total size of all files below path, walked with os.scandir"""
+    total = 0
+    stack = [path]
+    
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    
+    return total
+
+def get_tree_sizes(paths):
+    """Size several directory trees concurrently"""
+    if len(paths) < 2:
+        return {path: get_tree_size(path) for path in paths}
+    
+    with ThreadPoolExecutor(SCAN_WORKERS) as executor:
+        return dict(zip(paths, executor.map(get_tree_size, paths)))
+
+def delete_group(directory, entries):
+    """Delete entries sharing one parent directory, resolving names via a dir fd"""
+    deleted_count = 0
+    deleted_size = 0
+    errors = []
+    dir_fd = None
+    
+    # Unlinking relative to an open directory avoids re-resolving the full
+    # path for every item; fall back to plain paths where unsupported
+    if os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            dir_fd = None
+    
+    try:
+        for entry in entries:
+            try:
+                if dir_fd is not None:
+                    name = os.path.basename(entry["path"])
+                    if entry["is_dir"]:
+                        if sys.version_info >= (3, 11) and shutil.rmtree.avoids_symlink_attacks:
+                            shutil.rmtree(name, dir_fd=dir_fd)
+                        else:
+                            shutil.rmtree(entry["path"])
+                    else:
+                        os.unlink(name, dir_fd=dir_fd)
+                elif entry["is_dir"]:
+                    shutil.rmtree(entry["path"])
+                else:
+                    os.remove(entry["path"])
+                deleted_count += 1
+                deleted_size += entry["size"]
+            except Exception as e:
+                errors.append((entry["path"], e))
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    
+    return deleted_count, deleted_size, errors
+
+def delete_entries(entries, workers=DELETE_WORKERS):
+    """Delete planned entries on a bounded worker pool, reporting in aggregate"""
+    groups = {}
+    for entry in entries:
+        groups.setdefault(os.path.dirname(entry["path"]), []).append(entry)
+    
+    # Split large directories into batches so they spread across workers
+    batches = [(directory, group[i:i + DELETE_BATCH])
+               for directory, group in groups.items()
+               for i in range(0, len(group), DELETE_BATCH)]
+    
+    deleted_count = 0
+    deleted_size = 0
+    errors = []
+    total = len(entries)
+    
+    show_progress = sys.stdout.isatty()
+    
+    with ThreadPoolExecutor(min(workers, len(batches)) or 1) as executor:
+        futures = [executor.submit(delete_group, directory, batch) for directory, batch in batches]
+        for future in as_completed(futures):
+            count, size, group_errors = future.result()
+            deleted_count += count
+            deleted_size += size
+            errors.extend(group_errors)
+            
+            if show_progress:
+                done = deleted_count + len(errors)
+                sys.stdout.write(f"\rDeleting: {done}/{total} items ({format_bytes(deleted_size)})")
+                sys.stdout.flush()
+    
+    if show_progress:
+        sys.stdout.write("\r" + " " * 60 + "\r")
+    
+    if errors:
+        print(f"{ERROR}Failed to delete {len(errors)} items:{Style.RESET_ALL}")
+        for path, e in errors[:10]:
+            print(f"{ERROR}  {path}: {e}{Style.RESET_ALL}")
+        if len(errors) > 10:
+            print(f"{ERROR}  ... and {len(errors) - 10} more{Style.RESET_ALL}")
+    
+    return deleted_count, deleted_size
+
+def record_plan(entries, category):
+    """Add simulated deletions to the plan being recorded, if any"""
+    if PLAN_ENTRIES is None:
+        return
+    
+    for entry in entries:
+        PLAN_ENTRIES.append({
+            "path": os.path.abspath(entry["path"]),
+            "size": entry["size"],
+            "mtime": entry["mtime"],
+            "inode": entry["inode"],
+            "dev": entry["dev"],
+            "is_dir": entry["is_dir"],
+            "category": category,
+        })
+
+def save_plan(plan_file):
+    """Write the recorded plan as JSON for 'sigma.clean apply'"""
+    plan = {
+        "version": PLAN_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "root": get_sigmaos_root(),
+        "entries": PLAN_ENTRIES or [],
+    }
+    
+    try:
+        with open(plan_file, 'w') as f:
+            json.dump(plan, f, indent=2)
+    except OSError as e:
+        print(f"{ERROR}Error writing plan: {e}{Style.RESET_ALL}")
+        return
+    
+    total_size = sum(entry["size"] for entry in plan["entries"])
+    print(f"{SUCCESS}Plan with {len(plan['entries'])} items ({format_bytes(total_size)}) written to {plan_file}{Style.RESET_ALL}")
+    print(f"{INFO}Run 'sigma.clean apply {plan_file}' to execute it.{Style.RESET_ALL}")
+
+def verify_plan_entry(entry, root):
+    """Return None if entry is unchanged since planning, else the reason to skip it"""
+    path = os.path.realpath(entry["path"])
+    if not path.startswith(root + os.sep):
+        return "outside the SigmaOS directory"
+    
+    try:
+        st = os.lstat(entry["path"])
+    except FileNotFoundError:
+        return "no longer exists"
+    except OSError as e:
+        return str(e)
+    
+    # Inode catches replaced files; mtime catches files modified in place
+    if st.st_ino != entry["inode"] or (entry["dev"] and st.st_dev != entry["dev"]):
+        return "replaced since the plan was made"
+    if st.st_mtime != entry["mtime"]:
+        return "modified since the plan was made"
+    return None
+
+def apply_plan(plan_file, simulate=False):
+    """Delete the entries of a saved plan without rescanning, skipping changed ones"""
+    try:
+        with open(plan_file, 'r') as f:
+            plan = json.load(f)
+        entries = plan["entries"]
+        if plan.get("version") != PLAN_VERSION:
+            raise ValueError(f"unsupported plan version {plan.get('version')}")
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"{ERROR}Error reading plan: {e}{Style.RESET_ALL}")
+        return 0
+    
+    print(f"{HEADER}Applying cleanup plan from {plan.get('created', 'unknown date')}:{Style.RESET_ALL}")
+    
+    root = os.path.realpath(get_sigmaos_root())
+    with ThreadPoolExecutor(SCAN_WORKERS) as executor:
+        reasons = list(executor.map(lambda entry: verify_plan_entry(entry, root), entries))
+    
+    valid = [entry for entry, reason in zip(entries, reasons) if reason is None]
+    skipped = [(entry, reason) for entry, reason in zip(entries, reasons) if reason is not None]
+    
+    if skipped:
+        print(f"{WARNING}Skipping {len(skipped)} items:{Style.RESET_ALL}")
+        for entry, reason in skipped[:10]:
+            print(f"{WARNING}  {entry['path']}: {reason}{Style.RESET_ALL}")
+        if len(skipped) > 10:
+            print(f"{WARNING}  ... and {len(skipped) - 10} more{Style.RESET_ALL}")
+    
+    if simulate:
+        for entry in valid:
+            print(f"{INFO}Would delete: {entry['path']} - {format_bytes(entry['size'])}{Style.RESET_ALL}")
+        deleted_count = len(valid)
+        deleted_size = sum(entry["size"] for entry in valid)
+    else:
+        deleted_count, deleted_size = delete_entries(valid) if valid else (0, 0)
+        if any(entry["category"] == "logs" for entry in valid):
+            prune_log_indexes(os.path.join(get_sigmaos_root(), "logs"))
+    
+    print(f"{SUCCESS}Deleted {deleted_count} items ({format_bytes(deleted_size)}){' (simulated)' if simulate else ''}{Style.RESET_ALL}")
+    return deleted_count
+
 def clean_logs(days=None, simulate=False):
     """Clean log files older than specified days"""
     logs_dir = os.path.join(get_sigmaos_root(), "logs")
@@ -41,35 +316,32 @@ def clean_logs(days=None, simulate=False):
         print(f"{WARNING}No logs directory found.{Style.RESET_ALL}")
         return 0
     
-    log_files = glob.glob(os.path.join(logs_dir, "*.log"))
+    log_files = [entry for entry in scan_dir(logs_dir, LOG_PATTERNS) if not entry["is_dir"]]
     
     if not log_files:
         print(f"{WARNING}No log files found to clean.{Style.RESET_ALL}")
         return 0
     
-    deleted_count = 0
-    deleted_size = 0
     now = time.time()
+    plan = []
     
     print(f"{HEADER}Cleaning log files:{Style.RESET_ALL}")
     
-    for log_file in log_files:
-        file_age_days = (now - os.path.getmtime(log_file)) / (60 * 60 * 24)
-        file_size = os.path.getsize(log_file)
+    for entry in log_files:
+        file_age_days = (now - entry["mtime"]) / (60 * 60 * 24)
         
         if days is None or file_age_days >= days:
+            plan.append(entry)
             if simulate:
-                print(f"{INFO}Would delete: {os.path.basename(log_file)} - {format_bytes(file_size)} - {file_age_days:.1f} days old{Style.RESET_ALL}")
-                deleted_count += 1
-                deleted_size += file_size
-            else:
-                try:
-                    os.remove(log_file)
-                    print(f"{SUCCESS}Deleted: {os.path.basename(log_file)} - {format_bytes(file_size)} - {file_age_days:.1f} days old{Style.RESET_ALL}")
-                    deleted_count += 1
-                    deleted_size += file_size
-                except Exception as e:
-                    print(f"{ERROR}Error deleting {log_file}: {e}{Style.RESET_ALL}")
+                print(f"{INFO}Would delete: {entry['name']} - {format_bytes(entry['size'])} - {file_age_days:.1f} days old{Style.RESET_ALL}")
+    
+    if simulate:
+        record_plan(plan, "logs")
+        deleted_count = len(plan)
+        deleted_size = sum(entry["size"] for entry in plan)
+    else:
+        deleted_count, deleted_size = delete_entries(plan)
+        prune_log_indexes(logs_dir)
     
     if deleted_count > 0:
         print(f"{SUCCESS}Deleted {deleted_count} log files ({format_bytes(deleted_size)}){' (simulated)' if simulate else ''}{Style.RESET_ALL}")
@@ -82,43 +354,22 @@ def clean_temp_files(simulate=False):
     """Clean temporary files in the SigmaOS directory"""
     sigmaos_root = get_sigmaos_root()
     
-    temp_patterns = [
-        os.path.join(sigmaos_root, "*.tmp"),
-        os.path.join(sigmaos_root, "*.temp"),
-        os.path.join(sigmaos_root, "temp*.*"),
-        os.path.join(sigmaos_root, "tmp*.*"),
-        os.path.join(sigmaos_root, "*.~*"),
-        os.path.join(sigmaos_root, "*.__*"),
-    ]
-    
-    temp_files = []
-    for pattern in temp_patterns:
-        temp_files.extend(glob.glob(pattern))
+    temp_files = [entry for entry in scan_dir(sigmaos_root, TEMP_PATTERNS) if not entry["is_dir"]]
     
     if not temp_files:
         print(f"{WARNING}No temporary files found to clean.{Style.RESET_ALL}")
         return 0
     
-    deleted_count = 0
-    deleted_size = 0
-    
     print(f"{HEADER}Cleaning temporary files:{Style.RESET_ALL}")
     
-    for temp_file in temp_files:
-        file_size = os.path.getsize(temp_file)
-        
-        if simulate:
-            print(f"{INFO}Would delete: {os.path.basename(temp_file)} - {format_bytes(file_size)}{Style.RESET_ALL}")
-            deleted_count += 1
-            deleted_size += file_size
-        else:
-            try:
-                os.remove(temp_file)
-                print(f"{SUCCESS}Deleted: {os.path.basename(temp_file)} - {format_bytes(file_size)}{Style.RESET_ALL}")
-                deleted_count += 1
-                deleted_size += file_size
-            except Exception as e:
-                print(f"{ERROR}Error deleting {temp_file}: {e}{Style.RESET_ALL}")
+    if simulate:
+        for entry in temp_files:
+            print(f"{INFO}Would delete: {entry['name']} - {format_bytes(entry['size'])}{Style.RESET_ALL}")
+        record_plan(temp_files, "temp")
+        deleted_count = len(temp_files)
+        deleted_size = sum(entry["size"] for entry in temp_files)
+    else:
+        deleted_count, deleted_size = delete_entries(temp_files)
     
     if deleted_count > 0:
         print(f"{SUCCESS}Deleted {deleted_count} temporary files ({format_bytes(deleted_size)}){' (simulated)' if simulate else ''}{Style.RESET_ALL}")
@@ -136,57 +387,28 @@ def clean_package_cache(simulate=False):
         return 0
     
     # Look for cache directories and __pycache__ in all packages
-    cache_patterns = [
-        os.path.join(packages_dir, "*", "__pycache__"),
-        os.path.join(packages_dir, "*", "*.pyc"),
-        os.path.join(packages_dir, "*", "cache"),
-        os.path.join(packages_dir, "*", ".cache"),
-        os.path.join(packages_dir, "*", "tmp"),
-        os.path.join(packages_dir, "*", "temp"),
-    ]
-    
-    deleted_count = 0
-    deleted_size = 0
+    cache_items = []
+    for package in scan_dir(packages_dir, ["*"]):
+        if package["is_dir"]:
+            cache_items.extend(scan_dir(package["path"], CACHE_PATTERNS))
     
     print(f"{HEADER}Cleaning package cache:{Style.RESET_ALL}")
     
-    # Handle directories like __pycache__
-    for pattern in cache_patterns:
-        for item in glob.glob(pattern):
-            if os.path.isdir(item):
-                dir_size = 0
-                for dirpath, dirnames, filenames in os.walk(item):
-                    for f in filenames:
-                        fp = os.path.join(dirpath, f)
-                        dir_size += os.path.getsize(fp)
-                
-                if simulate:
-                    print(f"{INFO}Would delete directory: {item} - {format_bytes(dir_size)}{Style.RESET_ALL}")
-                    deleted_count += 1
-                    deleted_size += dir_size
-                else:
-                    try:
-                        shutil.rmtree(item)
-                        print(f"{SUCCESS}Deleted directory: {item} - {format_bytes(dir_size)}{Style.RESET_ALL}")
-                        deleted_count += 1
-                        deleted_size += dir_size
-                    except Exception as e:
-                        print(f"{ERROR}Error deleting directory {item}: {e}{Style.RESET_ALL}")
-            elif os.path.isfile(item):
-                file_size = os.path.getsize(item)
-                
-                if simulate:
-                    print(f"{INFO}Would delete file: {item} - {format_bytes(file_size)}{Style.RESET_ALL}")
-                    deleted_count += 1
-                    deleted_size += file_size
-                else:
-                    try:
-                        os.remove(item)
-                        print(f"{SUCCESS}Deleted file: {item} - {format_bytes(file_size)}{Style.RESET_ALL}")
-                        deleted_count += 1
-                        deleted_size += file_size
-                    except Exception as e:
-                        print(f"{ERROR}Error deleting file {item}: {e}{Style.RESET_ALL}")
+    # Size all cache directories in one parallel pass
+    dir_sizes = get_tree_sizes([item["path"] for item in cache_items if item["is_dir"]])
+    for entry in cache_items:
+        if entry["is_dir"]:
+            entry["size"] = dir_sizes[entry["path"]]
+    
+    if simulate:
+        for entry in cache_items:
+            kind = "directory" if entry["is_dir"] else "file"
+            print(f"{INFO}Would delete {kind}: {entry['path']} - {format_bytes(entry['size'])}{Style.RESET_ALL}")
+        record_plan(cache_items, "cache")
+        deleted_count = len(cache_items)
+        deleted_size = sum(entry["size"] for entry in cache_items)
+    else:
+        deleted_count, deleted_size = delete_entries(cache_items)
     
     if deleted_count > 0:
         print(f"{SUCCESS}Cleaned {deleted_count} package cache items ({format_bytes(deleted_size)}){' (simulated)' if simulate else ''}{Style.RESET_ALL}")
@@ -195,48 +417,761 @@ def clean_package_cache(simulate=False):
     
     return deleted_count
 
+def parse_size(text):
+    """Parse a size like 500MB or 2GB into bytes, or None if invalid"""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?)I?B?\s*", text.upper())
+    if not match:
+        return None
+    try:
+        value = float(match.group(1))
+    except ValueError:
+        return None
+    return int(value * 1024 ** " KMGT".index(match.group(2) or " "))
+
+def parse_percent(text):
+    """Parse a percentage like 10% into a float, or None if invalid"""
+    try:
+        value = float(text.strip().rstrip("%"))
+    except ValueError:
+        return None
+    return value if 0 <= value <= 100 else None
+
+def get_disk_usage():
+    """Return psutil disk usage for the SigmaOS root, or None without psutil"""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.disk_usage(get_sigmaos_root())
+
+def compress_log(entry):
+    """Gzip a log file in place, keeping its mtime; returns the new entry"""
+    target = entry["path"] + ".gz"
+    tmp_target = target + ".tmp"
+    try:
+        with open(entry["path"], 'rb') as src, gzip.open(tmp_target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.utime(tmp_target, (entry["mtime"], entry["mtime"]))
+        os.replace(tmp_target, target)
+        os.remove(entry["path"])
+    except Exception:
+        if os.path.exists(tmp_target):
+            os.remove(tmp_target)
+        raise
+    
+    return dict(entry, path=target, name=os.path.basename(target), size=os.path.getsize(target))
+
+def estimate_compressed_size(entry, sample_size=1024 * 1024):
+    """Estimate a log's gzip size by compressing a sample from its start"""
+    with open(entry["path"], 'rb') as f:
+        sample = f.read(sample_size)
+    if not sample:
+        return 0
+    ratio = len(zlib.compress(sample, 6)) / len(sample)
+    return int(entry["size"] * ratio)
+
+def prune_log_indexes(logs_dir):
+    """Remove sigma.viewlogs sidecar indexes whose log file no longer exists"""
+    index_dir = os.path.join(logs_dir, ".index")
+    for entry in scan_dir(index_dir, ["*.idx", "*.idx.off", "*.idx.lvl"]):
+        log_name = entry["name"][:entry["name"].rindex(".idx")]
+        if not os.path.exists(os.path.join(logs_dir, log_name)):
+            try:
+                os.remove(entry["path"])
+            except OSError:
+                pass
+
+def clean_logs_budget(max_size=None, keep_free=None, compress=False, simulate=False):
+    """Delete (or compress) the oldest logs until a size or free-space budget is met"""
+    logs_dir = os.path.join(get_sigmaos_root(), "logs")
+    
+    if not os.path.exists(logs_dir):
+        print(f"{WARNING}No logs directory found.{Style.RESET_ALL}")
+        return 0
+    
+    log_files = [entry for entry in scan_dir(logs_dir, LOG_PATTERNS) if not entry["is_dir"]]
+    total_size = sum(entry["size"] for entry in log_files)
+    
+    # Work out how many bytes have to go to satisfy every budget given
+    excess = 0
+    if max_size is not None:
+        excess = max(excess, total_size - max_size)
+    if keep_free is not None:
+        disk_usage = get_disk_usage()
+        if disk_usage is None:
+            print(f"{ERROR}psutil module is required for --keep-free.{Style.RESET_ALL}")
+            return 0
+        excess = max(excess, int(disk_usage.total * keep_free / 100) - disk_usage.free)
+    
+    print(f"{HEADER}Cleaning log files to budget:{Style.RESET_ALL}")
+    print(f"{INFO}Logs use {format_bytes(total_size)} in {len(log_files)} files.{Style.RESET_ALL}")
+    
+    if excess <= 0:
+        print(f"{SUCCESS}Log files are within budget.{Style.RESET_ALL}")
+        return 0
+    
+    print(f"{INFO}Need to free {format_bytes(excess)}.{Style.RESET_ALL}")
+    
+    # Oldest first
+    heap = [(entry["mtime"], entry["path"], entry) for entry in log_files]
+    heapq.heapify(heap)
+    
+    freed = 0
+    compressed_count = 0
+    plan = []
+    
+    if compress:
+        # First pass: compress plain logs, oldest first; remember archives
+        archives = []
+        while heap and freed < excess:
+            mtime, path, entry = heapq.heappop(heap)
+            if not path.endswith(".log"):
+                archives.append((mtime, path, entry))
+                continue
+            
+            if simulate:
+                new_size = estimate_compressed_size(entry)
+                print(f"{INFO}Would compress: {entry['name']} - {format_bytes(entry['size'])} -> ~{format_bytes(new_size)}{Style.RESET_ALL}")
+                new_entry = dict(entry, size=new_size)
+            else:
+                try:
+                    new_entry = compress_log(entry)
+                except Exception as e:
+                    print(f"{ERROR}Error compressing {entry['name']}: {e}{Style.RESET_ALL}")
+                    continue
+            
+            freed += entry["size"] - new_entry["size"]
+            compressed_count += 1
+            archives.append((mtime, new_entry["path"], new_entry))
+        
+        # Anything left over (and all archives) is a deletion candidate
+        heap.extend(archives)
+        heapq.heapify(heap)
+    
+    # Delete oldest files until the remaining excess is covered
+    while heap and freed < excess:
+        _, _, entry = heapq.heappop(heap)
+        plan.append(entry)
+        freed += entry["size"]
+        if simulate:
+            age_days = (time.time() - entry["mtime"]) / (60 * 60 * 24)
+            print(f"{INFO}Would delete: {entry['name']} - {format_bytes(entry['size'])} - {age_days:.1f} days old{Style.RESET_ALL}")
+    
+    if simulate:
+        # Simulated compressions don't exist on disk, so they can't be replayed
+        if compress and PLAN_ENTRIES is not None:
+            print(f"{WARNING}Plans can't record compression; run without --compress to save a plan.{Style.RESET_ALL}")
+        else:
+            record_plan(plan, "logs")
+        deleted_count = len(plan)
+        deleted_size = sum(entry["size"] for entry in plan)
+    else:
+        deleted_count, deleted_size = delete_entries(plan) if plan else (0, 0)
+        prune_log_indexes(logs_dir)
+    
+    suffix = " (simulated)" if simulate else ""
+    if compressed_count:
+        print(f"{SUCCESS}Compressed {compressed_count} log files{suffix}{Style.RESET_ALL}")
+    print(f"{SUCCESS}Deleted {deleted_count} log files ({format_bytes(deleted_size)}){suffix}{Style.RESET_ALL}")
+    
+    if freed < excess:
+        print(f"{WARNING}Budget not met: only {format_bytes(freed)} of {format_bytes(excess)} could be freed from logs.{Style.RESET_ALL}")
+    
+    return deleted_count + compressed_count
+
 def check_disk_space():
     """Check disk space and show usage"""
+    try:
+        disk_usage = get_disk_usage()
+    except Exception as e:
+        print(f"{ERROR}Error checking disk space: {e}{Style.RESET_ALL}")
+        return
+    
+    if disk_usage is None:
+        print(f"{ERROR}psutil module is required for disk space check.{Style.RESET_ALL}")
+        return
+    
+    total = format_bytes(disk_usage.total)
+    used = format_bytes(disk_usage.used)
+    free = format_bytes(disk_usage.free)
+    percent = disk_usage.percent
+    
+    print(f"{HEADER}Disk Space:{Style.RESET_ALL}")
+    print(f"{INFO}Total:{Style.RESET_ALL} {total}")
+    print(f"{INFO}Used:{Style.RESET_ALL} {used} ({percent}%)")
+    print(f"{INFO}Free:{Style.RESET_ALL} {free}")
+    
+    # Warning if disk space is low
+    if percent >= 90:
+        print(f"{ERROR}Warning: Disk space is critically low!{Style.RESET_ALL}")
+    elif percent >= 80:
+        print(f"{WARNING}Warning: Disk space is running low.{Style.RESET_ALL}")
+
+# Areas of the SigmaOS root always listed by the disk usage analyzer
+DU_AREAS = ["packages", "documents", "logs", "benchmark_results"]
+
+# Largest files remembered per directory in the disk usage cache
+DU_TOP_FILES = 20
+
+def get_du_cache_file():
+    """Returns the path of the disk usage cache"""
+    return os.path.join(get_sigmaos_root(), ".cache", "du_cache.json")
+
+def load_du_cache():
+    """Load cached per-directory scan results"""
+    try:
+        with open(get_du_cache_file(), 'r') as f:
+            return json.load(f).get("dirs", {})
+    except (OSError, ValueError):
+        return {}
+
+def save_du_cache(dirs):
+    """Write per-directory scan results atomically"""
+    cache_file = get_du_cache_file()
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = cache_file + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump({"dirs": dirs}, f)
+    os.replace(tmp_file, cache_file)
+
+def summarize_files(sized_files):
+    """Total size, count and largest files of (size, name) pairs"""
+    files_size = 0
+    file_count = 0
+    top_files = []
+    for size, name in sized_files:
+        files_size += size
+        file_count += 1
+        if len(top_files) < DU_TOP_FILES:
+            heapq.heappush(top_files, (size, name))
+        elif size > top_files[0][0]:
+            heapq.heapreplace(top_files, (size, name))
+    return files_size, file_count, top_files
+
+def scan_dir_cached(path, cache, results, stats):
+    """Scan one directory, reusing the cached listing if its mtime is unchanged"""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    
+    record = cache.get(path)
+    sized_files = []
+    if record and record["mtime_ns"] == mtime_ns and "files" in record:
+        # Appending to a file does not touch the directory's mtime,
+        # so only the listing is reused and sizes are read fresh
+        files = record["files"]
+        subdirs = record["subdirs"]
+        for name in files:
+            try:
+                sized_files.append((os.lstat(os.path.join(path, name)).st_size, name))
+            except OSError:
+                pass
+        stats["cached"] += 1
+    else:
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        else:
+                            sized_files.append((entry.stat(follow_symlinks=False).st_size, entry.name))
+                            files.append(entry.name)
+                    except OSError:
+                        pass
+        except OSError:
+            return None
+        stats["scanned"] += 1
+    
+    files_size, file_count, top_files = summarize_files(sized_files)
+    record = {
+        "mtime_ns": mtime_ns,
+        "files_size": files_size,
+        "file_count": file_count,
+        "top_files": top_files,
+        "files": files,
+        "subdirs": subdirs,
+    }
+    results[path] = record
+    return record
+
+def scan_tree_cached(path, cache, results, stats):
+    """Total size of a tree, rescanning only directories whose mtime changed"""
+    record = scan_dir_cached(path, cache, results, stats)
+    if record is None:
+        return 0
+    
+    total = record["files_size"]
+    for name in record["subdirs"]:
+        total += scan_tree_cached(os.path.join(path, name), cache, results, stats)
+    record["total_size"] = total
+    return total
+
+def analyze_disk_usage(top=10, refresh=False):
+    """Show the largest directories and files under the SigmaOS root"""
     sigmaos_root = get_sigmaos_root()
+    cache = {} if refresh else load_du_cache()
+    results = {}
+    stats = {"scanned": 0, "cached": 0}
+    lock = threading.Lock()
+    
+    print(f"{HEADER}Analyzing disk usage of {sigmaos_root}...{Style.RESET_ALL}")
+    start_time = time.time()
+    
+    root_record = scan_dir_cached(sigmaos_root, cache, results, stats)
+    if root_record is None:
+        print(f"{ERROR}Cannot read {sigmaos_root}{Style.RESET_ALL}")
+        return
+    
+    def scan_subtree(name):
+        # Each subtree gets its own result dict, merged under the lock
+        sub_results = {}
+        sub_stats = {"scanned": 0, "cached": 0}
+        size = scan_tree_cached(os.path.join(sigmaos_root, name), cache, sub_results, sub_stats)
+        with lock:
+            results.update(sub_results)
+            stats["scanned"] += sub_stats["scanned"]
+            stats["cached"] += sub_stats["cached"]
+        return size
+    
+    with ThreadPoolExecutor(SCAN_WORKERS) as executor:
+        subtree_sizes = list(executor.map(scan_subtree, root_record["subdirs"]))
+    root_record["total_size"] = root_record["files_size"] + sum(subtree_sizes)
+    
+    try:
+        save_du_cache(results)
+    except OSError as e:
+        print(f"{WARNING}Could not save disk usage cache: {e}{Style.RESET_ALL}")
+    
+    elapsed = time.time() - start_time
+    total = root_record["total_size"]
     
+    print(f"{INFO}Total:{Style.RESET_ALL} {format_bytes(total)} in {len(results)} directories "
+          f"({stats['scanned']} scanned, {stats['cached']} from cache, {elapsed:.2f}s)")
+    
+    print(f"\n{HEADER}SigmaOS Areas:{Style.RESET_ALL}")
+    for area in DU_AREAS:
+        record = results.get(os.path.join(sigmaos_root, area))
+        size = format_bytes(record["total_size"]) if record else "-"
+        print(f"{COMMAND}  {area + '/':<22}{DESCRIPTION}{size}{Style.RESET_ALL}")
+    
+    print(f"\n{HEADER}Largest Directories:{Style.RESET_ALL}")
+    directories = sorted(((record["total_size"], path) for path, record in results.items() if path != sigmaos_root), reverse=True)
+    for size, path in directories[:top]:
+        print(f"{INFO}  {format_bytes(size):>12}{Style.RESET_ALL}  {os.path.relpath(path, sigmaos_root)}")
+    
+    # The overall largest files are among each directory's largest files
+    print(f"\n{HEADER}Largest Files:{Style.RESET_ALL}")
+    files = heapq.nlargest(top, ((size, os.path.join(path, name))
+                                 for path, record in results.items()
+                                 for size, name in record["top_files"]))
+    for size, path in files:
+        print(f"{INFO}  {format_bytes(size):>12}{Style.RESET_ALL}  {os.path.relpath(path, sigmaos_root)}")
+
+# Directories searched for duplicate files
+DUPE_DIRS = ["documents", "downloads"]
+
+# Bytes hashed from each end of a file before committing to a full hash
+PARTIAL_HASH_SIZE = 64 * 1024
+
+def walk_files(path):
+    """Yield (path, stat) for every regular file below path"""
+    stack = [path]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry.path, entry.stat(follow_symlinks=False)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+def hash_file(path, partial=False):
+    """Hash a whole file, or only its first and last PARTIAL_HASH_SIZE bytes"""
+    digest = hashlib.blake2b()
+    try:
+        with open(path, 'rb') as f:
+            if partial:
+                digest.update(f.read(PARTIAL_HASH_SIZE))
+                size = os.fstat(f.fileno()).st_size
+                if size > PARTIAL_HASH_SIZE:
+                    f.seek(max(PARTIAL_HASH_SIZE, size - PARTIAL_HASH_SIZE))
+                    digest.update(f.read(PARTIAL_HASH_SIZE))
+            else:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def group_by_hash(groups, partial, executor):
+    """Split candidate groups into groups of equal hashes, hashing every file
+    of every group in one pass over the thread pool"""
+    files = [(number, path, st) for number, group in enumerate(groups) for path, st in group]
+    hashes = executor.map(lambda item: hash_file(item[1], partial), files)
+    
+    result = {}
+    for (number, path, st), digest in zip(files, hashes):
+        if digest is not None:
+            result.setdefault((number, digest), []).append((path, st))
+    return [group for group in result.values() if len(group) > 1]
+
+def find_duplicates(directories):
+    """Find groups of identical files: by size, then partial hash, then full hash"""
+    by_size = {}
+    for directory in directories:
+        for path, st in walk_files(directory):
+            if st.st_size > 0:
+                by_size.setdefault(st.st_size, []).append((path, st))
+    
+    candidates = []
+    for files in by_size.values():
+        # Paths that are already hardlinks of each other take no extra space
+        unique = {}
+        for path, st in files:
+            unique.setdefault((st.st_dev, st.st_ino), (path, st))
+        if len(unique) > 1:
+            candidates.append(list(unique.values()))
+    
+    with ThreadPoolExecutor(SCAN_WORKERS) as executor:
+        duplicates = []
+        full_candidates = []
+        for group in group_by_hash(candidates, True, executor):
+            if group[0][1].st_size <= 2 * PARTIAL_HASH_SIZE:
+                # The partial hash already covered the whole file
+                duplicates.append(group)
+            else:
+                full_candidates.append(group)
+        duplicates.extend(group_by_hash(full_candidates, False, executor))
+    
+    # Keep the oldest copy of each group first
+    for group in duplicates:
+        group.sort(key=lambda item: (item[1].st_mtime, item[0]))
+    duplicates.sort(key=lambda group: group[0][1].st_size * (len(group) - 1), reverse=True)
+    return duplicates
+
+def hardlink_duplicate(original, duplicate):
+    """Atomically replace duplicate with a hard link to original"""
+    tmp_path = duplicate + ".sigma_link.tmp"
+    os.link(original, tmp_path)
+    try:
+        os.replace(tmp_path, duplicate)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+
+def clean_duplicates(action=None, simulate=False):
+    """Report duplicate files in documents and downloads, optionally hardlinking or deleting them"""
+    sigmaos_root = get_sigmaos_root()
+    directories = [os.path.join(sigmaos_root, name) for name in DUPE_DIRS
+                   if os.path.isdir(os.path.join(sigmaos_root, name))]
+    
+    if not directories:
+        print(f"{WARNING}No documents or downloads directory found.{Style.RESET_ALL}")
+        return 0
+    
+    print(f"{HEADER}Searching for duplicate files:{Style.RESET_ALL}")
+    duplicates = find_duplicates(directories)
+    
+    if not duplicates:
+        print(f"{INFO}No duplicate files were found.{Style.RESET_ALL}")
+        return 0
+    
+    wasted = 0
+    for group in duplicates:
+        size = group[0][1].st_size
+        wasted += size * (len(group) - 1)
+        print(f"\n{INFO}{len(group)} copies of {format_bytes(size)}:{Style.RESET_ALL}")
+        print(f"{SUCCESS}  keep: {os.path.relpath(group[0][0], sigmaos_root)}{Style.RESET_ALL}")
+        for path, _ in group[1:]:
+            print(f"{DESCRIPTION}  dup:  {os.path.relpath(path, sigmaos_root)}{Style.RESET_ALL}")
+    
+    print(f"\n{INFO}Found {len(duplicates)} groups of duplicates wasting {format_bytes(wasted)}.{Style.RESET_ALL}")
+    
+    if action is None:
+        print(f"{INFO}Use 'sigma.clean dupes --hardlink' or 'sigma.clean dupes --delete' to reclaim space.{Style.RESET_ALL}")
+        return 0
+    
+    if simulate:
+        verb = "hardlink" if action == "hardlink" else "delete"
+        count = sum(len(group) - 1 for group in duplicates)
+        if action == "delete":
+            record_plan([{"path": path, "size": st.st_size, "mtime": st.st_mtime, "inode": st.st_ino,
+                          "dev": st.st_dev, "is_dir": False}
+                         for group in duplicates for path, st in group[1:]], "dupes")
+        elif PLAN_ENTRIES is not None:
+            print(f"{WARNING}Plans can't record hardlinks; use --delete to save a plan.{Style.RESET_ALL}")
+        print(f"{SUCCESS}Would {verb} {count} duplicate files ({format_bytes(wasted)}) (simulated){Style.RESET_ALL}")
+        return count
+    
+    if action == "delete":
+        plan = [{"path": path, "size": st.st_size, "is_dir": False}
+                for group in duplicates for path, st in group[1:]]
+        deleted_count, deleted_size = delete_entries(plan)
+        print(f"{SUCCESS}Deleted {deleted_count} duplicate files ({format_bytes(deleted_size)}){Style.RESET_ALL}")
+        return deleted_count
+    
+    linked_count = 0
+    linked_size = 0
+    for group in duplicates:
+        original = group[0][0]
+        for path, st in group[1:]:
+            try:
+                hardlink_duplicate(original, path)
+                linked_count += 1
+                linked_size += st.st_size
+            except OSError as e:
+                print(f"{ERROR}Error linking {path}: {e}{Style.RESET_ALL}")
+    print(f"{SUCCESS}Hardlinked {linked_count} duplicate files ({format_bytes(linked_size)} reclaimed){Style.RESET_ALL}")
+    return linked_count
+
+# Background cleanup daemon defaults
+DAEMON_INTERVAL_HOURS = 24
+DAEMON_THRESHOLD = 90
+DAEMON_LOG_DAYS = 30
+DAEMON_CHECK_SECONDS = 60
+DAEMON_MIN_GAP_SECONDS = 10 * 60
+
+def get_daemon_pid_file():
+    """Returns the path of the cleanup daemon's pid file"""
+    return os.path.join(get_sigmaos_root(), ".cache", "clean_daemon.pid")
+
+def get_daemon_log_file():
+    """Returns the path of the cleanup daemon's log file"""
+    return os.path.join(get_sigmaos_root(), "logs", "clean_daemon.log")
+
+def get_process_cmdline(pid):
+    """Return the command line of a process, or None if it cannot be read"""
     try:
         import psutil
-        disk_usage = psutil.disk_usage(sigmaos_root)
-        
-        total = format_bytes(disk_usage.total)
-        used = format_bytes(disk_usage.used)
-        free = format_bytes(disk_usage.free)
-        percent = disk_usage.percent
-        
-        print(f"{HEADER}Disk Space:{Style.RESET_ALL}")
-        print(f"{INFO}Total:{Style.RESET_ALL} {total}")
-        print(f"{INFO}Used:{Style.RESET_ALL} {used} ({percent}%)")
-        print(f"{INFO}Free:{Style.RESET_ALL} {free}")
-        
-        # Warning if disk space is low
-        if percent >= 90:
-            print(f"{ERROR}Warning: Disk space is critically low!{Style.RESET_ALL}")
-        elif percent >= 80:
-            print(f"{WARNING}Warning: Disk space is running low.{Style.RESET_ALL}")
-        
     except ImportError:
-        print(f"{ERROR}psutil module is required for disk space check.{Style.RESET_ALL}")
+        psutil = None
+    
+    if psutil:
+        try:
+            return psutil.Process(pid).cmdline()
+        except psutil.Error:
+            return None
+    
+    try:
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            return f.read().decode(errors="replace").split("\0")[:-1]
+    except OSError:
+        return None
+
+def is_daemon_cmdline(cmdline):
+    """Check whether a command line is 'clean.py daemon run'"""
+    for i, arg in enumerate(cmdline):
+        if os.path.basename(arg) == "clean.py" and cmdline[i + 1:i + 3] == ["daemon", "run"]:
+            return True
+    return False
+
+def read_daemon_pid():
+    """Return the pid of the running daemon, or None"""
+    try:
+        with open(get_daemon_pid_file(), 'r') as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+    
+    # A stale pid file may point at an unrelated process after a crash or reboot
+    cmdline = get_process_cmdline(pid)
+    if not cmdline or not is_daemon_cmdline(cmdline):
+        return None
+    return pid
+
+def daemon_log(level, message):
+    """Write a timestamped line to the daemon log (its stdout)"""
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print(f"[{timestamp}] [{level}] {message}", flush=True)
+
+def set_idle_priority():
+    """Drop CPU and I/O priority so cleanup never competes with the shell"""
+    if hasattr(os, "nice"):
+        try:
+            os.nice(19)
+        except OSError:
+            pass
+    
+    try:
+        import psutil
+        process = psutil.Process()
+        if hasattr(psutil, "IOPRIO_CLASS_IDLE"):
+            process.ionice(psutil.IOPRIO_CLASS_IDLE)
+        elif hasattr(psutil, "IDLE_PRIORITY_CLASS"):
+            process.nice(psutil.IDLE_PRIORITY_CLASS)
+    except (ImportError, OSError, AttributeError):
+        pass
     except Exception as e:
-        print(f"{ERROR}Error checking disk space: {e}{Style.RESET_ALL}")
+        daemon_log("WARNING", f"Could not lower I/O priority: {e}")
+
+def run_cleanup_policies(log_days):
+    """Run the regular cleanup policies"""
+    cleaned = 0
+    cleaned += clean_logs(log_days)
+    cleaned += clean_temp_files()
+    cleaned += clean_package_cache()
+    return cleaned
+
+def run_daemon(interval_hours, threshold, log_days):
+    """Cleanup loop: run on a schedule, or early when disk usage crosses the threshold"""
+    pid_file = get_daemon_pid_file()
+    os.makedirs(os.path.dirname(pid_file), exist_ok=True)
+    with open(pid_file, 'w') as f:
+        f.write(str(os.getpid()))
+    
+    # Turn SIGTERM into a normal exit so the pid file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    set_idle_priority()
+    
+    interval = interval_hours * 60 * 60
+    last_run = 0
+    daemon_log("INFO", f"Cleanup daemon started (every {interval_hours:g}h, threshold {threshold:g}%, logs older than {log_days:g} days)")
+    
+    try:
+        while True:
+            now = time.time()
+            reason = None
+            
+            if now - last_run >= interval:
+                reason = "scheduled"
+            else:
+                disk_usage = get_disk_usage()
+                if (disk_usage is not None and disk_usage.percent >= threshold
+                        and now - last_run >= DAEMON_MIN_GAP_SECONDS):
+                    reason = f"disk usage at {disk_usage.percent}%"
+            
+            if reason:
+                daemon_log("INFO", f"Running cleanup ({reason})")
+                try:
+                    cleaned = run_cleanup_policies(log_days)
+                    daemon_log("SUCCESS", f"Cleanup finished, {cleaned} items removed")
+                except Exception as e:
+                    daemon_log("ERROR", f"Cleanup failed: {e}")
+                last_run = time.time()
+            
+            time.sleep(DAEMON_CHECK_SECONDS)
+    finally:
+        daemon_log("INFO", "Cleanup daemon stopped")
+        try:
+            os.remove(pid_file)
+        except OSError:
+            pass
+
+def start_daemon(options):
+    """Start the cleanup daemon as a detached background process"""
+    pid = read_daemon_pid()
+    if pid:
+        print(f"{WARNING}Cleanup daemon is already running (PID {pid}).{Style.RESET_ALL}")
+        return
+    
+    log_file = get_daemon_log_file()
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    
+    command = [sys.executable, os.path.abspath(__file__), "daemon", "run"] + options
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    
+    with open(log_file, 'a') as log:
+        process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=log,
+                                   stderr=subprocess.STDOUT, close_fds=True, **kwargs)
+    
+    print(f"{SUCCESS}Cleanup daemon started (PID {process.pid}).{Style.RESET_ALL}")
+    print(f"{INFO}Log: {log_file}{Style.RESET_ALL}")
+
+def stop_daemon():
+    """Stop the running cleanup daemon"""
+    pid = read_daemon_pid()
+    if not pid:
+        print(f"{WARNING}Cleanup daemon is not running.{Style.RESET_ALL}")
+        return
+    
+    try:
+        os.kill(pid, signal.SIGTERM)
+        print(f"{SUCCESS}Cleanup daemon stopped (PID {pid}).{Style.RESET_ALL}")
+    except OSError as e:
+        print(f"{ERROR}Error stopping cleanup daemon: {e}{Style.RESET_ALL}")
+
+def daemon_command(args):
+    """Handle 'sigma.clean daemon [start|stop|status|run] [options]'"""
+    action = "start"
+    if args and not args[0].startswith("--"):
+        action = args[0].lower()
+        args = args[1:]
+    
+    interval_hours = DAEMON_INTERVAL_HOURS
+    threshold = DAEMON_THRESHOLD
+    log_days = DAEMON_LOG_DAYS
+    
+    options = list(args)
+    while options:
+        option = options.pop(0)
+        try:
+            if option == "--interval" and options:
+                interval_hours = float(options.pop(0))
+            elif option == "--threshold" and options:
+                threshold = parse_percent(options.pop(0))
+                if threshold is None:
+                    raise ValueError
+            elif option == "--log-days" and options:
+                log_days = float(options.pop(0))
+            else:
+                raise ValueError
+        except ValueError:
+            print(f"{ERROR}Invalid daemon option: {option}{Style.RESET_ALL}")
+            return
+    
+    if action == "start":
+        start_daemon(list(args))
+    elif action == "stop":
+        stop_daemon()
+    elif action == "status":
+        pid = read_daemon_pid()
+        if pid:
+            print(f"{SUCCESS}Cleanup daemon is running (PID {pid}).{Style.RESET_ALL}")
+            print(f"{INFO}Log: {get_daemon_log_file()}{Style.RESET_ALL}")
+        else:
+            print(f"{WARNING}Cleanup daemon is not running.{Style.RESET_ALL}")
+    elif action == "run":
+        run_daemon(interval_hours, threshold, log_days)
+    else:
+        print(f"{ERROR}Unknown daemon command: {action}{Style.RESET_ALL}")
 
 def show_help():
     """Show help for clean commands"""
     print(f"\n{HEADER}System Cleaning Commands:{Style.RESET_ALL}")
     print(f"{COMMAND}  sigma.clean{DESCRIPTION} - Clean all temporary files")
     print(f"{COMMAND}  sigma.clean logs [days]{DESCRIPTION} - Clean logs older than X days (default: all)")
+    print(f"{COMMAND}  sigma.clean logs --max-size <size>{DESCRIPTION} - Delete oldest logs until they fit, e.g. 2GB")
+    print(f"{COMMAND}  sigma.clean logs --keep-free <pct>{DESCRIPTION} - Delete oldest logs until X% of the disk is free")
+    print(f"{COMMAND}  sigma.clean logs ... --compress{DESCRIPTION} - Compress oldest logs first, then delete if needed")
     print(f"{COMMAND}  sigma.clean temp{DESCRIPTION} - Clean temporary files")
     print(f"{COMMAND}  sigma.clean cache{DESCRIPTION} - Clean package cache")
     print(f"{COMMAND}  sigma.clean space{DESCRIPTION} - Check disk space")
+    print(f"{COMMAND}  sigma.clean dupes [--hardlink|--delete]{DESCRIPTION} - Find duplicate documents and downloads")
+    print(f"{COMMAND}  sigma.clean daemon [options]{DESCRIPTION} - Start background cleanup (--interval <hours> --threshold <pct> --log-days <days>)")
+    print(f"{COMMAND}  sigma.clean daemon stop|status{DESCRIPTION} - Stop or check the background cleanup")
+    print(f"{COMMAND}  sigma.clean du [n] [--refresh]{DESCRIPTION} - Show the N largest directories and files (default: 10)")
     print(f"{COMMAND}  sigma.clean simulate{DESCRIPTION} - Show what would be cleaned without actually deleting")
+    print(f"{COMMAND}  sigma.clean simulate [command] --plan <file>{DESCRIPTION} - Also save the simulated deletions as a plan")
+    print(f"{COMMAND}  sigma.clean apply <file>{DESCRIPTION} - Delete the items of a saved plan that haven't changed since")
     print()
 
 def main():
     """Main entry point for clean module"""
+    global PLAN_ENTRIES
     args = sys.argv[1:] if len(sys.argv) > 1 else []
     
     if not args:
@@ -259,12 +1194,23 @@ def main():
     
     command = args[0].lower()
     simulate = False
+    plan_file = None
     
     # Check if simulation mode is requested
     if command == "simulate":
         simulate = True
+        if "--plan" in args:
+            index = args.index("--plan")
+            if index + 1 >= len(args):
+                print(f"{ERROR}Usage: sigma.clean simulate [command] --plan <file>{Style.RESET_ALL}")
+                return
+            plan_file = args[index + 1]
+            args = args[:index] + args[index + 2:]
+            PLAN_ENTRIES = []
+        
         if len(args) > 1:
-            command = args[1].lower()
+            args = args[1:]
+            command = args[0].lower()
         else:
             # Default behavior in simulate mode
             print(f"{HEADER}SigmaOS Cleanup Utility (SIMULATION MODE){Style.RESET_ALL}")
@@ -281,28 +1227,83 @@ def main():
                 print(f"\n{WARNING}No items found to clean up in simulation.{Style.RESET_ALL}")
                 
             check_disk_space()
+            if plan_file:
+                save_plan(plan_file)
             return
     
     if command == "help":
         show_help()
     elif command == "logs":
         days = None
-        if len(args) >= 2:
-            try:
-                days = float(args[1])
-            except ValueError:
-                print(f"{ERROR}Invalid number of days: {args[1]}{Style.RESET_ALL}")
-                return
-        clean_logs(days, simulate)
+        max_size = None
+        keep_free = None
+        compress = False
+        
+        options = args[1:]
+        while options:
+            option = options.pop(0)
+            if option == "--compress":
+                compress = True
+            elif option == "--max-size" and options:
+                max_size = parse_size(options.pop(0))
+                if max_size is None:
+                    print(f"{ERROR}Invalid size. Use e.g. 500MB or 2GB.{Style.RESET_ALL}")
+                    return
+            elif option == "--keep-free" and options:
+                keep_free = parse_percent(options.pop(0))
+                if keep_free is None:
+                    print(f"{ERROR}Invalid percentage. Use e.g. 10%.{Style.RESET_ALL}")
+                    return
+            else:
+                try:
+                    days = float(option)
+                except ValueError:
+                    print(f"{ERROR}Invalid number of days: {option}{Style.RESET_ALL}")
+                    return
+        
+        if max_size is not None or keep_free is not None:
+            clean_logs_budget(max_size, keep_free, compress, simulate)
+        else:
+            clean_logs(days, simulate)
     elif command == "temp":
         clean_temp_files(simulate)
     elif command == "cache":
         clean_package_cache(simulate)
     elif command == "space":
         check_disk_space()
+    elif command == "apply":
+        if len(args) < 2:
+            print(f"{ERROR}Usage: sigma.clean apply <plan file>{Style.RESET_ALL}")
+            return
+        apply_plan(args[1], simulate)
+    elif command == "daemon":
+        daemon_command(args[1:])
+    elif command == "dupes":
+        action = None
+        if "--hardlink" in args:
+            action = "hardlink"
+        elif "--delete" in args:
+            action = "delete"
+        clean_duplicates(action, simulate)
+    elif command == "du":
+        top = 10
+        refresh = "--refresh" in args
+        for arg in args[1:]:
+            if arg == "--refresh":
+                continue
+            try:
+                top = int(arg)
+            except ValueError:
+                print(f"{ERROR}Invalid number: {arg}{Style.RESET_ALL}")
+                return
+        analyze_disk_usage(top, refresh)
     else:
         print(f"{ERROR}Unknown command: {command}{Style.RESET_ALL}")
         show_help()
+        return
+    
+    if plan_file:
+        save_plan(plan_file)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
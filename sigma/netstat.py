@@ -5,6 +5,7 @@ import platform
 import socket
 import time
 import re
+import json
 import psutil
 from colorama import Fore, Style, init
 
@@ -36,6 +37,19 @@ def format_bytes(size, per_second=False):
     suffix = "/s" if per_second else ""
     return f"{size:.2f} {power_labels[n]}{suffix}"
 
+def print_json_records(records, record_type):
+    """Write records as newline-delimited JSON in a single write"""
+    lines = []
+    for record in records:
+        # Display-only fields are left out, empty placeholders become null
+        record = {key: None if key == "pid" and value == "" else value
+                  for key, value in record.items() if key != "state_color"}
+        lines.append(json.dumps({"type": record_type, **record}) + "\n")
+    
+    stream = sys.__stdout__ or sys.stdout
+    stream.write("".join(lines))
+    stream.flush()
+
 def get_process_name(pid):
     """Get process name for a PID"""
     try:
@@ -86,7 +100,7 @@ def get_connections():
             })
         
     except Exception as e:
-        print(f"{ERROR}Error getting connections: {e}{Style.RESET_ALL}")
+        print(f"{ERROR}Error getting connections: {e}{Style.RESET_ALL}", file=sys.stderr)
     
     return connections
 
@@ -145,14 +159,18 @@ def get_network_stats():
                     })
     
     except Exception as e:
-        print(f"{ERROR}Error getting network stats: {e}{Style.RESET_ALL}")
+        print(f"{ERROR}Error getting network stats: {e}{Style.RESET_ALL}", file=sys.stderr)
     
     return stats
 
-def show_connections():
+def show_connections(as_json=False):
     """Display active network connections"""
     connections = get_connections()
     
+    if as_json:
+        print_json_records(connections, "connection")
+        return
+    
     if not connections:
         print(f"{WARNING}No active connections found.{Style.RESET_ALL}")
         return
@@ -173,10 +191,14 @@ def show_connections():
               f"{NET_PID}{pid:<7}{Style.RESET_ALL} "
               f"{NET_PROGRAM}{program}{Style.RESET_ALL}")
 
-def show_network_stats():
+def show_network_stats(as_json=False):
     """Display network interface statistics"""
     stats = get_network_stats()
     
+    if as_json:
+        print_json_records(stats, "interface")
+        return
+    
     if not stats:
         print(f"{WARNING}No active network interfaces found.{Style.RESET_ALL}")
         return
@@ -247,15 +269,19 @@ def get_listening_ports():
                 })
     
     except Exception as e:
-        print(f"{ERROR}Error getting listening ports: {e}{Style.RESET_ALL}")
+        print(f"{ERROR}Error getting listening ports: {e}{Style.RESET_ALL}", file=sys.stderr)
     
     # Sort by port number
     return sorted(listening, key=lambda x: x["port"])
 
-def show_listening_ports():
+def show_listening_ports(as_json=False):
     """Display all listening ports"""
     listening = get_listening_ports()
     
+    if as_json:
+        print_json_records(listening, "listening")
+        return
+    
     if not listening:
         print(f"{WARNING}No listening ports found.{Style.RESET_ALL}")
         return
@@ -287,14 +313,23 @@ def show_help():
     print(f"{COMMAND}  sigma.netstat conn{DESCRIPTION} - Show active connections")
     print(f"{COMMAND}  sigma.netstat listen{DESCRIPTION} - Show listening ports")
     print(f"{COMMAND}  sigma.netstat stats{DESCRIPTION} - Show interface statistics")
+    print(f"{COMMAND}  --json, --ndjson{DESCRIPTION} - Output records as JSON lines")
     print()
 
 def main():
     """Main entry point for netstat module"""
     args = sys.argv[1:] if len(sys.argv) > 1 else []
     
+    as_json = "--json" in args or "--ndjson" in args
+    args = [arg for arg in args if arg not in ("--json", "--ndjson")]
+    
     if not args:
         # Show all information by default
+        if as_json:
+            show_connections(as_json=True)
+            show_listening_ports(as_json=True)
+            show_network_stats(as_json=True)
+            return
         show_connections()
         print()
         show_listening_ports()
@@ -307,11 +342,11 @@ def main():
     if command == "help":
         show_help()
     elif command in ["conn", "connections"]:
-        show_connections()
+        show_connections(as_json=as_json)
     elif command in ["listen", "listening", "ports"]:
-        show_listening_ports()
+        show_listening_ports(as_json=as_json)
     elif command in ["stats", "interfaces"]:
-        show_network_stats()
+        show_network_stats(as_json=as_json)
     else:
         print(f"{ERROR}Unknown command: {command}{Style.RESET_ALL}")
         show_help()
@@ -1,5 +1,6 @@
 import os
 import sys
+import json
 import psutil
 import datetime
 import platform
@@ -34,6 +35,12 @@ def format_bytes(size):
         n += 1
     return f"{size:.2f} {power_labels[n]}"
 
+def print_json_records(records):
+    """Write records as newline-delimited JSON in a single write"""
+    stream = sys.__stdout__ or sys.stdout
+    stream.write("".join(json.dumps(record) + "\n" for record in records))
+    stream.flush()
+
 def get_processes(sort_by="cpu", top=None, filter_text=None):
     """Get list of running processes with details"""
     processes = []
@@ -80,7 +87,7 @@ def get_processes(sort_by="cpu", top=None, filter_text=None):
                 pass
     
     except Exception as e:
-        print(f"{ERROR}Error getting process list: {e}{Style.RESET_ALL}")
+        print(f"{ERROR}Error getting process list: {e}{Style.RESET_ALL}", file=sys.stderr)
     
     # Sort processes
     if sort_by == "cpu":
@@ -100,10 +107,14 @@ def get_processes(sort_by="cpu", top=None, filter_text=None):
     
     return processes
 
-def show_processes(sort_by="cpu", top=None, filter_text=None, detailed=False):
+def show_processes(sort_by="cpu", top=None, filter_text=None, detailed=False, as_json=False):
     """Display list of running processes"""
     processes = get_processes(sort_by, top, filter_text)
     
+    if as_json:
+        print_json_records(processes)
+        return
+    
     if not processes:
         print(f"{WARNING}No processes found.{Style.RESET_ALL}")
         if filter_text:
@@ -174,14 +185,19 @@ def get_process_tree():
                 tree[pid] = proc
     
     except Exception as e:
-        print(f"{ERROR}Error building process tree: {e}{Style.RESET_ALL}")
+        print(f"{ERROR}Error building process tree: {e}{Style.RESET_ALL}", file=sys.stderr)
     
     return tree
 
-def show_process_tree():
+def show_process_tree(as_json=False):
     """Display process tree"""
     tree = get_process_tree()
     
+    if as_json:
+        # One record per top-level process, children nested
+        print_json_records(tree.values())
+        return
+    
     if not tree:
         print(f"{WARNING}Could not build process tree.{Style.RESET_ALL}")
         return
@@ -279,15 +295,19 @@ def show_help():
     print(f"{COMMAND}  sigma.proclist find <text>{DESCRIPTION} - Find processes by name")
     print(f"{COMMAND}  sigma.proclist pid <pid>{DESCRIPTION} - Show details for specific PID")
     print(f"{COMMAND}  sigma.proclist tree{DESCRIPTION} - Show process tree")
+    print(f"{COMMAND}  --json, --ndjson{DESCRIPTION} - Output process list or tree as JSON lines")
     print()
 
 def main():
     """Main entry point for proclist module"""
     args = sys.argv[1:] if len(sys.argv) > 1 else []
     
+    as_json = "--json" in args or "--ndjson" in args
+    args = [arg for arg in args if arg not in ("--json", "--ndjson")]
+    
     if not args:
         # Default behavior: show process list sorted by CPU
-        show_processes()
+        show_processes(as_json=as_json)
         return
     
     command = args[0].lower()
@@ -297,24 +317,24 @@ def main():
     elif command == "top" and len(args) >= 2:
         try:
             top = int(args[1])
-            show_processes(top=top)
+            show_processes(top=top, as_json=as_json)
         except ValueError:
             print(f"{ERROR}Invalid number: {args[1]}{Style.RESET_ALL}")
             show_help()
     elif command == "sort" and len(args) >= 2:
         sort_by = args[1].lower()
         if sort_by in ["cpu", "memory", "pid", "name", "time"]:
-            show_processes(sort_by=sort_by)
+            show_processes(sort_by=sort_by, as_json=as_json)
         else:
             print(f"{ERROR}Invalid sort type: {sort_by}{Style.RESET_ALL}")
             print(f"{INFO}Valid types: cpu, memory, pid, name, time{Style.RESET_ALL}")
     elif command == "detail":
-        show_processes(detailed=True)
+        show_processes(detailed=True, as_json=as_json)
     elif command == "find" and len(args) >= 2:
         filter_text = args[1]
-        show_processes(filter_text=filter_text)
+        show_processes(filter_text=filter_text, as_json=as_json)
     elif command == "tree":
-        show_process_tree()
+        show_process_tree(as_json=as_json)
     elif command == "pid" and len(args) >= 2:
         try:
             pid = int(args[1])
@@ -1,7 +1,22 @@
 import os
 import sys
 import glob
-from datetime import datetime
+import time
+import select
+import json
+import re
+import mmap
+import multiprocessing
+import io
+import gzip
+import bz2
+import lzma
+import shutil
+from itertools import islice, chain
+import hashlib
+from array import array
+from collections import deque, Counter
+from datetime import datetime, date
 from colorama import Fore, Style, init
 
 # Initialize colorama
@@ -22,6 +37,35 @@ LOG_SUCCESS = Fore.GREEN
 LOG_TIMESTAMP = Fore.CYAN
 LOG_NORMAL = Fore.WHITE
 
+# Bulk log output is written in chunks of roughly this many characters
+OUTPUT_BUFFER_SIZE = 256 * 1024
+
+# Color for log output; turned off with --no-color/--raw or when piped
+COLOR_OUTPUT = sys.stdout.isatty()
+
+# Emit one JSON record per log line instead of formatted text (--json/--ndjson)
+JSON_OUTPUT = False
+
+# Plain and compressed log file extensions
+LOG_EXTENSIONS = (".log", ".log.gz", ".log.bz2", ".log.xz", ".log.zst")
+COMPRESSED_EXTENSIONS = (".gz", ".bz2", ".xz", ".zst")
+
+# Level detection, in priority order
+LEVEL_MARKERS = [
+    ("ERROR", ("[ERROR]", "Error:", "Exception")),
+    ("WARNING", ("[WARNING]", "Warning:")),
+    ("SUCCESS", ("[SUCCESS]", "Success:")),
+    ("INFO", ("[INFO]", "Info:")),
+]
+LEVEL_MARKERS_BYTES = [(level, tuple(m.encode() for m in markers)) for level, markers in LEVEL_MARKERS]
+LEVEL_COLORS = {
+    "ERROR": LOG_ERROR,
+    "WARNING": LOG_WARNING,
+    "SUCCESS": LOG_SUCCESS,
+    "INFO": LOG_INFO,
+    "NORMAL": LOG_NORMAL,
+}
+
 def get_sigmaos_root():
     """Returns the path to the SigmaOS root directory"""
     package_dir = os.path.dirname(os.path.abspath(__file__))
@@ -38,13 +82,66 @@ def ensure_logs_dir():
         os.makedirs(logs_dir)
     return logs_dir
 
+def find_log_files(logs_dir=None):
+    """Return plain and compressed log files, newest name first"""
+    logs_dir = logs_dir or get_logs_dir()
+    log_files = []
+    for ext in LOG_EXTENSIONS:
+        log_files.extend(glob.glob(os.path.join(logs_dir, "*" + ext)))
+    return sorted(log_files, reverse=True)
+
+def is_compressed(log_file):
+    """Check whether a log file is stored compressed"""
+    return log_file.endswith(COMPRESSED_EXTENSIONS)
+
+def open_log(log_file):
+    """Open a log file for binary reading, decompressing on the fly"""
+    if log_file.endswith(".gz"):
+        return gzip.open(log_file, 'rb')
+    if log_file.endswith(".bz2"):
+        return bz2.open(log_file, 'rb')
+    if log_file.endswith(".xz"):
+        return lzma.open(log_file, 'rb')
+    if log_file.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstandard module is required for .zst logs")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(log_file, 'rb'), closefd=True)
+        return io.BufferedReader(reader)
+    return open(log_file, 'rb')
+
+def open_compressed_writer(path, fmt):
+    """Open a compressed file for binary writing in the given format"""
+    if fmt == "gz":
+        return gzip.open(path, 'wb')
+    if fmt == "bz2":
+        return bz2.open(path, 'wb')
+    if fmt == "xz":
+        return lzma.open(path, 'wb')
+    if fmt == "zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstandard module is required for .zst logs")
+        return zstandard.ZstdCompressor().stream_writer(open(path, 'wb'), closefd=True)
+    raise ValueError(f"Unknown compression format: {fmt}")
+
+def format_size(file_size):
+    """Format a file size for display"""
+    if file_size < 1024:
+        return f"{file_size} B"
+    elif file_size < 1024 * 1024:
+        return f"{file_size/1024:.1f} KB"
+    return f"{file_size/(1024*1024):.1f} MB"
+
 def list_logs():
     """List all log files in the logs directory"""
     logs_dir = ensure_logs_dir()
-    log_files = glob.glob(os.path.join(logs_dir, "*.log"))
+    log_files = find_log_files(logs_dir)
     
     if not log_files:
-        print(f"{WARNING}No log files found.{Style.RESET_ALL}")
+        print_status(f"{WARNING}No log files found.{Style.RESET_ALL}")
         return []
     
     print(f"\n{HEADER}Available Log Files:{Style.RESET_ALL}")
@@ -52,91 +149,1018 @@ def list_logs():
         file_name = os.path.basename(log_file)
         file_size = os.path.getsize(log_file)
         file_time = datetime.fromtimestamp(os.path.getmtime(log_file)).strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Format file size
-        if file_size < 1024:
-            size_str = f"{file_size} B"
-        elif file_size < 1024 * 1024:
-            size_str = f"{file_size/1024:.1f} KB"
-        else:
-            size_str = f"{file_size/(1024*1024):.1f} MB"
+        size_str = format_size(file_size)
             
         print(f"{INFO}{i+1}.{Style.RESET_ALL} {file_name} - {DESCRIPTION}{size_str} - {file_time}")
     
     return log_files
 
+def read_lines(log_file):
+    """Yield lines from a log file one at a time"""
+    with io.TextIOWrapper(open_log(log_file), encoding='utf-8', errors='replace') as f:
+        for line in f:
+            yield line
+
+def tail_lines(log_file, count, block_size=64 * 1024, f=None, end=None):
+    """Yield the last count lines of a log file (or of open file f up to end) by reading backwards"""
+    if f is None:
+        with open(log_file, 'rb') as f:
+            yield from tail_lines(log_file, count, block_size, f, end)
+        return
+    
+    # Work against the size at open time so bytes appended while we read
+    # (or a rotation that swaps the path) don't shift the offsets
+    pos = os.fstat(f.fileno()).st_size if end is None else end
+    blocks = []
+    newlines = 0
+    
+    # One extra newline guarantees the oldest wanted line is complete
+    while pos > 0 and newlines <= count:
+        read_size = min(block_size, pos)
+        pos -= read_size
+        f.seek(pos)
+        block = f.read(read_size)
+        if len(block) < read_size:
+            # File was truncated underneath us; keep what we have
+            break
+        blocks.append(block)
+        newlines += block.count(b"\n")
+    
+    data = b"".join(reversed(blocks))
+    lines = data.split(b"\n")
+    if data.endswith(b"\n"):
+        lines.pop()
+    
+    for line in lines[-count:]:
+        yield line.decode('utf-8', errors='replace') + "\n"
+
+def filter_lines(lines, filter_text):
+    """Yield only lines containing filter_text (case-insensitive)"""
+    needle = filter_text.lower()
+    for line in lines:
+        if needle in line.lower():
+            yield line
+
+def error_lines(lines):
+    """Yield only lines that look like errors or exceptions"""
+    for line in lines:
+        lowered = line.lower()
+        if "error" in lowered or "exception" in lowered:
+            yield line
+
+def detect_level(line, markers=LEVEL_MARKERS):
+    """Return the level name of a log line (use LEVEL_MARKERS_BYTES for bytes)"""
+    for level, level_markers in markers:
+        for marker in level_markers:
+            if marker in line:
+                return level
+    return "NORMAL"
+
+def classify_line(line):
+    """Return the color for a log line based on its level"""
+    return LEVEL_COLORS[detect_level(line)]
+
+def colorize_lines(lines):
+    """Yield formatted, colored output for each non-empty log line"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        
+        if not COLOR_OUTPUT:
+            yield line
+            continue
+            
+        color = classify_line(line)
+        
+        # Highlight timestamp if present
+        if "]" in line and "[" in line:
+            timestamp_end = line.find("]") + 1
+            timestamp = line[:timestamp_end]
+            message = line[timestamp_end:]
+            yield f"{LOG_TIMESTAMP}{timestamp}{color}{message}{Style.RESET_ALL}"
+        else:
+            yield f"{color}{line}{Style.RESET_ALL}"
+
+def log_records(lines, log_file, line_numbers=None):
+    """Yield one JSON document per non-empty log line"""
+    name = os.path.basename(log_file)
+    line_numbers = line_numbers or []
+    for i, line in enumerate(lines):
+        text = line.rstrip("\r\n")
+        if not text.strip():
+            continue
+        
+        timestamp = None
+        if text.startswith("["):
+            end = text.find("]")
+            if end > 1:
+                timestamp = text[1:end]
+        
+        record = {"file": name, "level": detect_level(text), "timestamp": timestamp, "message": text}
+        if i < len(line_numbers):
+            record["line"] = line_numbers[i]
+        yield json.dumps(record)
+
+def format_lines(lines, log_file):
+    """Format log lines for output as colored text, plain text or JSON"""
+    if JSON_OUTPUT:
+        return log_records(lines, log_file)
+    return colorize_lines(lines)
+
+def print_status(message):
+    """Print a status message, sent to stderr when stdout carries JSON"""
+    print(message, file=sys.stderr if JSON_OUTPUT else sys.stdout)
+
+def get_output_stream():
+    """Return the stream bulk log output is written to"""
+    # colorama's autoreset wrapper flushes on every write; only Windows
+    # needs it to translate escape codes, elsewhere write to the real stdout
+    if COLOR_OUTPUT and os.name == "nt":
+        return sys.stdout
+    return sys.__stdout__ or sys.stdout
+
+def print_header(title):
+    """Print a section header, honouring the color setting"""
+    if JSON_OUTPUT:
+        return
+    if COLOR_OUTPUT:
+        print(f"\n{HEADER}{title}{Style.RESET_ALL}")
+    else:
+        print(f"\n{title}")
+
+def render(outputs):
+    """Write formatted lines in large chunks instead of one print per line"""
+    stream = get_output_stream()
+    sys.stdout.flush()
+    
+    buffer = []
+    buffered = 0
+    count = 0
+    for output in outputs:
+        buffer.append(output)
+        buffered += len(output) + 1
+        count += 1
+        if buffered >= OUTPUT_BUFFER_SIZE:
+            buffer.append("")
+            stream.write("\n".join(buffer))
+            buffer = []
+            buffered = 0
+    
+    if buffer:
+        buffer.append("")
+        stream.write("\n".join(buffer))
+    stream.flush()
+    return count
+
+def render_with_header(title, outputs):
+    """Render lines under a header, printing nothing if there are none"""
+    outputs = iter(outputs)
+    first = next(outputs, None)
+    if first is None:
+        return 0
+    print_header(title)
+    return render(chain([first], outputs))
+
 def view_log(log_file, lines=None, filter_text=None, show_errors_only=False):
     """View the contents of a log file"""
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            content = f.readlines()
+        # Compressed logs can't be seeked cheaply, so they always stream
+        seekable = not is_compressed(log_file)
+        
+        if seekable and lines and not filter_text and not show_errors_only:
+            # Plain tail: cost depends on the number of lines, not the file size
+            content = tail_lines(log_file, lines)
+        elif seekable and show_errors_only and not filter_text:
+            # Jump straight to error lines via the sidecar index
+            content = indexed_error_lines(log_file, update_index(log_file), lines)
+        else:
+            content = read_lines(log_file)
         
         # Apply filters
         if filter_text:
-            content = [line for line in content if filter_text.lower() in line.lower()]
+            content = filter_lines(content, filter_text)
         
-        if show_errors_only:
-            content = [line for line in content if "error" in line.lower() or "exception" in line.lower()]
+        if show_errors_only and (filter_text or not seekable):
+            content = error_lines(content)
             
-        # Limit lines if specified
-        if lines:
-            content = content[-lines:]
+        # Limit lines if specified; only the last N lines are kept in memory
+        if lines and (filter_text or not seekable):
+            content = iter(deque(content, maxlen=lines))
             
-        if not content:
-            print(f"{WARNING}No log entries match the criteria.{Style.RESET_ALL}")
-            return
+        printed = render_with_header(f"Log File: {os.path.basename(log_file)}", format_lines(content, log_file))
             
-        print(f"\n{HEADER}Log File: {os.path.basename(log_file)}{Style.RESET_ALL}")
+        if not printed:
+            print_status(f"{WARNING}No log entries match the criteria.{Style.RESET_ALL}")
+                
+    except Exception as e:
+        print_status(f"{ERROR}Error reading log file: {e}{Style.RESET_ALL}")
+
+# Sidecar index: a small JSON header plus append-only files holding one
+# offset and one level byte per complete line
+INDEX_VERSION = 2
+INDEX_SUFFIXES = ("", ".off", ".lvl")
+INDEX_LEVEL_CODES = {"NORMAL": 0, "ERROR": 1, "WARNING": 2, "SUCCESS": 3, "INFO": 4}
+INDEX_ERROR_FLAG = 0x80  # Line matches the errors-only filter
+INDEX_HEAD_BYTES = 4096
+
+def get_index_path(log_file):
+    """Returns the sidecar index path for a log file"""
+    log_dir, name = os.path.split(os.path.abspath(log_file))
+    return os.path.join(log_dir, ".index", name + ".idx")
+
+def hash_head(f, size):
+    """Hash the start of a file so in-place rewrites invalidate the index"""
+    f.seek(0)
+    return hashlib.sha1(f.read(min(size, INDEX_HEAD_BYTES))).hexdigest()
+
+def extract_timestamp(line):
+    """Return the leading [timestamp] text of a bytes line, or None"""
+    if line.startswith(b"["):
+        end = line.find(b"]")
+        if end > 1:
+            return line[1:end].decode('utf-8', errors='replace')
+    return None
+
+def load_index(log_file):
+    """Load the sidecar index for a log file, or None if missing or corrupt"""
+    index_path = get_index_path(log_file)
+    try:
+        with open(index_path, 'rb') as f:
+            meta = json.loads(f.read())
+        if meta.get("version") != INDEX_VERSION:
+            return None
         
-        for line in content:
-            # Color formatting based on log content
-            line = line.strip()
-            if not line:
+        # The data files may run past the header after an interrupted
+        # update; only the lines the header vouches for are used
+        offsets = array('Q')
+        levels = array('B')
+        with open(index_path + ".off", 'rb') as f:
+            offsets.frombytes(f.read(meta["lines"] * offsets.itemsize))
+        with open(index_path + ".lvl", 'rb') as f:
+            levels.frombytes(f.read(meta["lines"]))
+        if len(offsets) != meta["lines"] or len(levels) != meta["lines"]:
+            return None
+        return {"meta": meta, "offsets": offsets, "levels": levels}
+    except (OSError, ValueError, KeyError):
+        return None
+
+def save_index(log_file, index, start=0):
+    """Append index entries from line start onwards, then atomically rewrite the header"""
+    index_path = get_index_path(log_file)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    index["meta"]["lines"] = len(index["offsets"])
+    
+    for suffix, values in ((".off", index["offsets"]), (".lvl", index["levels"])):
+        with open(index_path + suffix, 'r+b' if start else 'wb') as f:
+            # Drop anything an interrupted update left past the last header
+            f.truncate(start * values.itemsize)
+            f.seek(0, os.SEEK_END)
+            values[start:].tofile(f)
+    
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(index["meta"], f)
+    os.replace(tmp_path, index_path)
+
+def update_index(log_file):
+    """Load the index for a log file, extending it with any newly written lines"""
+    with open(log_file, 'rb') as f:
+        st = os.fstat(f.fileno())
+        index = load_index(log_file)
+        
+        # Rebuild from scratch if the file was replaced, truncated or rewritten
+        if index:
+            meta = index["meta"]
+            if (meta["inode"] != st.st_ino or meta["indexed_size"] > st.st_size
+                    or meta["head"] != hash_head(f, meta["indexed_size"])):
+                index = None
+        
+        if index is None:
+            index = {
+                "meta": {
+                    "version": INDEX_VERSION,
+                    "inode": st.st_ino,
+                    "indexed_size": 0,
+                    "head": "",
+                    "first_timestamp": None,
+                    "last_timestamp": None,
+                    "counts": {level: 0 for level in INDEX_LEVEL_CODES},
+                },
+                "offsets": array('Q'),
+                "levels": array('B'),
+            }
+        
+        meta = index["meta"]
+        if meta["indexed_size"] == st.st_size:
+            return index
+        
+        offsets = index["offsets"]
+        levels = index["levels"]
+        counts = meta["counts"]
+        pos = meta["indexed_size"]
+        start = len(offsets)
+        f.seek(pos)
+        
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Partial line still being written; index it next time
+                break
+            
+            level = detect_level(line, LEVEL_MARKERS_BYTES)
+            code = INDEX_LEVEL_CODES[level]
+            lowered = line.lower()
+            if b"error" in lowered or b"exception" in lowered:
+                code |= INDEX_ERROR_FLAG
+            
+            offsets.append(pos)
+            levels.append(code)
+            counts[level] += 1
+            
+            timestamp = extract_timestamp(line)
+            if timestamp:
+                if meta["first_timestamp"] is None:
+                    meta["first_timestamp"] = timestamp
+                meta["last_timestamp"] = timestamp
+            
+            pos += len(line)
+        
+        if pos != meta["indexed_size"]:
+            meta["indexed_size"] = pos
+            meta["head"] = hash_head(f, pos)
+            save_index(log_file, index, start)
+    
+    return index
+
+def read_lines_at(log_file, offsets):
+    """Yield the lines starting at the given byte offsets"""
+    with open(log_file, 'rb') as f:
+        for offset in offsets:
+            f.seek(offset)
+            yield f.readline().decode('utf-8', errors='replace')
+
+def indexed_error_lines(log_file, index, lines=None):
+    """Yield errors-only lines using the index instead of scanning the file"""
+    # Lines written after the index was last extended (at most a partial line)
+    with open(log_file, 'rb') as f:
+        f.seek(index["meta"]["indexed_size"])
+        tail = f.read().decode('utf-8', errors='replace')
+    tail_errors = list(error_lines(tail.splitlines(keepends=True)))
+    
+    limit = None
+    if lines:
+        tail_errors = tail_errors[-lines:]
+        limit = lines - len(tail_errors)
+    
+    offsets = index["offsets"]
+    matches = [offsets[i] for i in flagged_lines(index["levels"], limit)] if limit != 0 else []
+    
+    yield from read_lines_at(log_file, matches)
+    yield from tail_errors
+
+INDEX_ERROR_BYTES = re.compile(rb"[\x80-\xff]")
+
+def flagged_lines(levels, limit=None, block_size=64 * 1024):
+    """Line numbers whose level byte has the error flag, scanning backwards and
+    stopping after limit matches; returned in file order"""
+    found = []
+    end = len(levels)
+    while end > 0 and (limit is None or len(found) < limit):
+        start = max(0, end - block_size)
+        block = levels[start:end].tobytes()
+        found.extend(start + match.start() for match in reversed(list(INDEX_ERROR_BYTES.finditer(block))))
+        end = start
+    
+    if limit is not None:
+        found = found[:limit]
+    found.reverse()
+    return found
+
+# Accepted timestamp formats besides ISO 8601; time-only ones need a date
+TIMESTAMP_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M:%S", "%d/%m/%Y %H:%M:%S"]
+TIME_ONLY_FORMATS = ["%H:%M:%S", "%H:%M"]
+
+def parse_timestamp(text, default_date=None):
+    """Parse a timestamp string, returning a datetime or None"""
+    text = text.strip()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    
+    if default_date:
+        for fmt in TIME_ONLY_FORMATS:
+            try:
+                return datetime.combine(default_date, datetime.strptime(text, fmt).time())
+            except ValueError:
                 continue
+    return None
+
+def line_timestamp(line):
+    """Return the parsed leading [timestamp] of a bytes line, or None"""
+    text = extract_timestamp(line)
+    return parse_timestamp(text) if text else None
+
+def next_timestamped_line(f, pos, size):
+    """Return (offset, timestamp) of the first timestamped line starting at or after pos"""
+    if pos > 0:
+        # Skip the line pos falls in, unless pos is exactly a line start
+        f.seek(pos - 1)
+        f.readline()
+    else:
+        f.seek(0)
+    
+    offset = f.tell()
+    while offset < size:
+        line = f.readline()
+        if not line:
+            break
+        ts = line_timestamp(line)
+        if ts:
+            return offset, ts
+        offset += len(line)
+    return size, None
+
+def find_time_offset(f, size, target, inclusive=True):
+    """Binary search for the first line whose timestamp is >= target (> if not inclusive)"""
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        _, ts = next_timestamped_line(f, mid, size)
+        if ts is None or (ts >= target if inclusive else ts > target):
+            hi = mid
+        else:
+            lo = mid + 1
+    return next_timestamped_line(f, lo, size)[0]
+
+def log_reference_date(log_file):
+    """Date used for time-only queries: the newest timestamped line of a plain
+    log, or the first one of a compressed archive (found without decompressing
+    the whole file)"""
+    if is_compressed(log_file):
+        for line in read_lines(log_file):
+            ts = line_timestamp(line.encode('utf-8'))
+            if ts:
+                return ts.date()
+    else:
+        for line in reversed(list(tail_lines(log_file, 100))):
+            ts = line_timestamp(line.encode('utf-8'))
+            if ts:
+                return ts.date()
+    return date.today()
+
+def time_range_lines(log_file, since=None, until=None):
+    """Yield lines logged between since and until (inclusive)"""
+    if is_compressed(log_file):
+        # No random access: filter while streaming, keeping untimestamped
+        # continuation lines with the entry they follow
+        in_range = False
+        for line in read_lines(log_file):
+            ts = line_timestamp(line.encode('utf-8'))
+            if ts:
+                if until and ts > until:
+                    break
+                in_range = not since or ts >= since
+            if in_range:
+                yield line
+        return
+    
+    with open(log_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        start = find_time_offset(f, size, since) if since else 0
+        end = find_time_offset(f, size, until, inclusive=False) if until else size
+        
+        f.seek(start)
+        pos = start
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            yield line.decode('utf-8', errors='replace')
+
+def view_time_range(log_file, since_text=None, until_text=None):
+    """View the lines of a log file between two timestamps"""
+    try:
+        reference = log_reference_date(log_file)
+        since = parse_timestamp(since_text, reference) if since_text else None
+        until = parse_timestamp(until_text, reference) if until_text else None
+        
+        for text, value in ((since_text, since), (until_text, until)):
+            if text and value is None:
+                print_status(f"{ERROR}Invalid timestamp: {text}{Style.RESET_ALL}")
+                return
+        
+        printed = render_with_header(f"Log File: {os.path.basename(log_file)}",
+                                     format_lines(time_range_lines(log_file, since, until), log_file))
+        
+        if not printed:
+            print_status(f"{WARNING}No log entries in the given time range.{Style.RESET_ALL}")
+            
+    except Exception as e:
+        print_status(f"{ERROR}Error reading log file: {e}{Style.RESET_ALL}")
+
+def view_page(log_file, page, page_size=100):
+    """View one page of a log file using its line index"""
+    try:
+        if page < 1:
+            print_status(f"{ERROR}Invalid page number.{Style.RESET_ALL}")
+            return
+        
+        start = (page - 1) * page_size
+        
+        if is_compressed(log_file):
+            # No index for compressed logs; stream up to the requested page
+            content = list(islice(read_lines(log_file), start, start + page_size))
+            if not content:
+                print_status(f"{ERROR}Invalid page number.{Style.RESET_ALL}")
+                return
+            print_header(f"Log File: {os.path.basename(log_file)} (page {page})")
+        else:
+            index = update_index(log_file)
+            total = len(index["offsets"])
+            pages = max(1, (total + page_size - 1) // page_size)
+            
+            if page > pages:
+                print_status(f"{ERROR}Invalid page number. Log has {pages} pages of {page_size} lines.{Style.RESET_ALL}")
+                return
+            
+            content = read_lines_at(log_file, index["offsets"][start:start + page_size])
+            print_header(f"Log File: {os.path.basename(log_file)} (page {page}/{pages})")
+        
+        render(format_lines(content, log_file))
+            
+    except Exception as e:
+        print_status(f"{ERROR}Error reading log file: {e}{Style.RESET_ALL}")
+
+def count_newlines(mm, start, end, chunk_size=1024 * 1024):
+    """Count newlines in mm[start:end] in bounded slices so memory stays flat"""
+    count = 0
+    while start < end:
+        stop = min(start + chunk_size, end)
+        count += mm[start:stop].count(b"\n")
+        start = stop
+    return count
+
+def search_file(task):
+    """Search one log file for a regex, returning up to limit (line_no, text) matches"""
+    log_file, pattern, limit = task
+    matches = []
+    
+    try:
+        if os.path.getsize(log_file) == 0:
+            return log_file, matches
+        
+        regex = re.compile(pattern.encode('utf-8'), re.MULTILINE)
+        
+        if is_compressed(log_file):
+            # Stream through the decompressor line by line
+            with open_log(log_file) as f:
+                for line_no, line in enumerate(f, 1):
+                    if regex.search(line.rstrip(b"\n")):
+                        matches.append((line_no, line.rstrip(b"\r\n").decode('utf-8', errors='replace')))
+                        if len(matches) >= limit:
+                            break
+            return log_file, matches
+        
+        with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            line_no = 1
+            counted_to = 0
+            size = len(mm)
+            
+            while pos < size and len(matches) < limit:
+                match = regex.search(mm, pos)
+                if not match:
+                    break
                 
-            if "[ERROR]" in line or "Error:" in line or "Exception" in line:
-                color = LOG_ERROR
-            elif "[WARNING]" in line or "Warning:" in line:
-                color = LOG_WARNING
-            elif "[SUCCESS]" in line or "Success:" in line:
-                color = LOG_SUCCESS
-            elif "[INFO]" in line or "Info:" in line:
-                color = LOG_INFO
-            else:
-                color = LOG_NORMAL
+                line_start = mm.rfind(b"\n", 0, match.start()) + 1
+                line_end = mm.find(b"\n", match.start())
+                if line_end == -1:
+                    line_end = size
                 
-            # Highlight timestamp if present
-            if "]" in line and "[" in line:
-                timestamp_end = line.find("]") + 1
-                timestamp = line[:timestamp_end]
-                message = line[timestamp_end:]
-                print(f"{LOG_TIMESTAMP}{timestamp}{color}{message}{Style.RESET_ALL}")
-            else:
-                print(f"{color}{line}{Style.RESET_ALL}")
+                # Patterns like \s can run across newlines; only count the
+                # line if the pattern also matches within it
+                if match.end() > line_end and not regex.search(mm[line_start:line_end]):
+                    pos = line_end + 1
+                    continue
+                
+                line_no += count_newlines(mm, counted_to, line_start)
+                counted_to = line_start
+                matches.append((line_no, mm[line_start:line_end].decode('utf-8', errors='replace')))
                 
+                # One hit per line; resume at the next line
+                pos = line_end + 1
+    except (OSError, ValueError, EOFError, RuntimeError, lzma.LZMAError):
+        pass
+    
+    return log_file, matches
+
+def search_logs(pattern, max_results=500):
+    """Search all log files in parallel for a regex"""
+    try:
+        re.compile(pattern.encode('utf-8'))
+    except re.error as e:
+        print_status(f"{ERROR}Invalid regular expression: {e}{Style.RESET_ALL}")
+        return
+    
+    log_files = find_log_files(ensure_logs_dir())
+    if not log_files:
+        print_status(f"{WARNING}No log files found.{Style.RESET_ALL}")
+        return
+    
+    print_status(f"\n{HEADER}Searching {len(log_files)} log files for: {pattern}{Style.RESET_ALL}")
+    
+    total = 0
+    files_matched = 0
+    tasks = [(log_file, pattern, max_results) for log_file in log_files]
+    processes = min(len(log_files), multiprocessing.cpu_count())
+    
+    try:
+        with multiprocessing.Pool(processes) as pool:
+            # imap keeps file order while later files are still being searched
+            for log_file, matches in pool.imap(search_file, tasks):
+                if not matches:
+                    continue
+                
+                files_matched += 1
+                name = os.path.basename(log_file)
+                matches = matches[:max_results - total]
+                total += len(matches)
+                if JSON_OUTPUT:
+                    render(log_records([text for _, text in matches], log_file,
+                                       [line_no for line_no, _ in matches]))
+                elif COLOR_OUTPUT:
+                    render(f"{INFO}{name}{Style.RESET_ALL}:{LOG_TIMESTAMP}{line_no}{Style.RESET_ALL}: {output}"
+                           for line_no, text in matches
+                           for output in colorize_lines([text]))
+                else:
+                    render(f"{name}:{line_no}: {output}"
+                           for line_no, text in matches
+                           for output in colorize_lines([text]))
+                
+                if total >= max_results:
+                    pool.terminate()
+                    break
     except Exception as e:
-        print(f"{ERROR}Error reading log file: {e}{Style.RESET_ALL}")
+        print_status(f"{ERROR}Error searching log files: {e}{Style.RESET_ALL}")
+        return
+    
+    if total == 0:
+        print_status(f"{WARNING}No log entries match the pattern.{Style.RESET_ALL}")
+    elif total >= max_results:
+        print_status(f"\n{WARNING}Stopped after {max_results} matches.{Style.RESET_ALL}")
+    else:
+        print_status(f"\n{SUCCESS}Found {total} matches in {files_matched} log files.{Style.RESET_ALL}")
+
+# Bucket widths for error-rate histograms, as timestamp prefix lengths
+STATS_BUCKETS = {"hour": 13, "minute": 16}
+STATS_CHUNK_SIZE = 4 * 1024 * 1024
+STATS_MAX_MESSAGES = 10000
+NORMALIZE_NUMBERS = re.compile(rb"0x[0-9a-fA-F]+|\d+")
+NORMALIZE_PREFIX = re.compile(rb"^(\[[^\]]*\]\s*){1,2}")
+DIGITS_TO_HASH = bytes.maketrans(b"0123456789", b"#" * 10)
+HASH_RUNS = re.compile(rb"#x[#a-fA-F]+|#{2,}")  # Masked hex numbers and digit runs
+ERROR_MARKERS_BYTES = dict(LEVEL_MARKERS_BYTES)["ERROR"]
+
+def normalize_message(line):
+    """Reduce a log line to a message template for frequency counting"""
+    message = NORMALIZE_PREFIX.sub(b"", line.strip())
+    message = NORMALIZE_NUMBERS.sub(b"#", message)
+    return message[:120]
+
+def chunk_templates(chunk):
+    """Count the message templates of a chunk, with every run of digits as one #"""
+    # Masking digits with translate and counting whole lines both run in C;
+    # runs of # (and hex numbers) are only collapsed once per distinct line
+    templates = Counter()
+    for line, count in Counter(chunk.translate(DIGITS_TO_HASH).split(b"\n")).items():
+        templates[HASH_RUNS.sub(b"#", line)] += count
+    return templates
 
-def delete_log(log_file):
+def prune_messages(messages, limit=STATS_MAX_MESSAGES):
+    """Keep the message table bounded; rare templates are dropped once it overflows"""
+    if len(messages) > 2 * limit:
+        return Counter(dict(messages.most_common(limit)))
+    return messages
+
+def error_timestamps(chunk):
+    """Timestamps of the lines in a chunk that contain an error marker"""
+    # Error markers have the highest priority, so any line holding one is an error
+    starts = set()
+    for marker in ERROR_MARKERS_BYTES:
+        pos = chunk.find(marker)
+        while pos != -1:
+            starts.add(chunk.rfind(b"\n", 0, pos) + 1)
+            pos = chunk.find(marker, pos + 1)
+    
+    for start in starts:
+        end = chunk.find(b"\n", start)
+        yield extract_timestamp(chunk[start:end if end != -1 else len(chunk)])
+
+def collect_stats(log_file, bucket="hour"):
+    """Aggregate level counts, error buckets and message frequencies chunk by chunk"""
+    bucket_len = STATS_BUCKETS[bucket]
+    stats = {
+        "bytes": os.path.getsize(log_file),
+        "lines": 0,
+        "levels": Counter(),
+        "errors": Counter(),
+        "messages": Counter(),
+    }
+    
+    with open_log(log_file) as f:
+        while True:
+            chunk = f.read(STATS_CHUNK_SIZE)
+            if not chunk:
+                break
+            if not chunk.endswith(b"\n"):
+                chunk += f.readline()
+            
+            # Level markers contain no digits, so each template has the same
+            # level as every line it stands for
+            chunk_errors = 0
+            for template, count in chunk_templates(chunk).items():
+                if not template.strip():
+                    continue
+                level = detect_level(template, LEVEL_MARKERS_BYTES)
+                stats["lines"] += count
+                stats["levels"][level] += count
+                stats["messages"][template] += count
+                if level == "ERROR":
+                    chunk_errors += count
+            
+            if chunk_errors:
+                for timestamp in error_timestamps(chunk):
+                    key = timestamp[:bucket_len] if timestamp and len(timestamp) >= bucket_len else "(no timestamp)"
+                    stats["errors"][key] += 1
+            
+            stats["messages"] = prune_messages(stats["messages"])
+    
+    return stats
+
+def show_stats(log_files, bucket="hour", top=10, max_buckets=48):
+    """Print a statistics report for one or more log files"""
+    totals = {"lines": 0, "levels": Counter(), "errors": Counter(), "messages": Counter()}
+    
+    print(f"\n{HEADER}Log Statistics:{Style.RESET_ALL}")
+    print(f"{COMMAND}{'File':<30} {'Size':<12} {'Lines':<12} {'Errors':<10}{Style.RESET_ALL}")
+    print("-" * 66)
+    
+    for log_file in log_files:
+        try:
+            stats = collect_stats(log_file, bucket)
+        except Exception as e:
+            print_status(f"{ERROR}Error reading {os.path.basename(log_file)}: {e}{Style.RESET_ALL}")
+            continue
+        
+        print(f"{INFO}{os.path.basename(log_file):<30}{Style.RESET_ALL} "
+              f"{DESCRIPTION}{format_size(stats['bytes']):<12} {stats['lines']:<12,}{Style.RESET_ALL} "
+              f"{LOG_ERROR}{stats['levels']['ERROR']:<10,}{Style.RESET_ALL}")
+        
+        totals["lines"] += stats["lines"]
+        for key in ("levels", "errors"):
+            totals[key].update(stats[key])
+        
+        # Finish normalizing the (bounded) template table for display
+        for template, count in stats["messages"].items():
+            totals["messages"][normalize_message(template)] += count
+        totals["messages"] = prune_messages(totals["messages"])
+    
+    if not totals["lines"]:
+        print_status(f"{WARNING}No log entries found.{Style.RESET_ALL}")
+        return
+    
+    print(f"\n{HEADER}Entries by Level:{Style.RESET_ALL}")
+    for level in ("ERROR", "WARNING", "SUCCESS", "INFO", "NORMAL"):
+        count = totals["levels"][level]
+        share = count / totals["lines"] * 100
+        print(f"{LEVEL_COLORS[level]}  {level:<10}{Style.RESET_ALL} {count:>12,}  ({share:.1f}%)")
+    
+    if totals["errors"]:
+        print(f"\n{HEADER}Errors per {bucket}:{Style.RESET_ALL}")
+        keys = sorted(totals["errors"])
+        if len(keys) > max_buckets:
+            print(f"{INFO}  (showing the last {max_buckets} of {len(keys)} buckets){Style.RESET_ALL}")
+            keys = keys[-max_buckets:]
+        peak = max(totals["errors"][key] for key in keys)
+        for key in keys:
+            count = totals["errors"][key]
+            bar = "█" * max(1, int(40 * count / peak))
+            print(f"{LOG_TIMESTAMP}  {key:<16}{Style.RESET_ALL} {count:>8,} {LOG_ERROR}{bar}{Style.RESET_ALL}")
+    
+    print(f"\n{HEADER}Top {top} Messages:{Style.RESET_ALL}")
+    for message, count in totals["messages"].most_common(top):
+        text = message.decode('utf-8', errors='replace')
+        print(f"{INFO}  {count:>8,}{Style.RESET_ALL}  {classify_line(text)}{text}{Style.RESET_ALL}")
+
+def compress_logs(days, fmt="gz"):
+    """Compress plain log files older than the given number of days in place"""
+    logs_dir = ensure_logs_dir()
+    log_files = glob.glob(os.path.join(logs_dir, "*.log"))
+    now = time.time()
+    
+    compressed = 0
+    failed = 0
+    saved = 0
+    
+    print(f"\n{HEADER}Compressing log files older than {days:g} days:{Style.RESET_ALL}")
+    
+    for log_file in sorted(log_files):
+        st = os.stat(log_file)
+        if (now - st.st_mtime) / (60 * 60 * 24) < days:
+            continue
+        
+        target = f"{log_file}.{fmt}"
+        tmp_target = target + ".tmp"
+        try:
+            # Stream through the compressor so nothing is buffered whole
+            with open(log_file, 'rb') as src, open_compressed_writer(tmp_target, fmt) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.utime(tmp_target, (st.st_atime, st.st_mtime))
+            os.replace(tmp_target, target)
+            
+            new_size = os.path.getsize(target)
+            delete_log(log_file, quiet=True)
+            compressed += 1
+            saved += st.st_size - new_size
+            print(f"{SUCCESS}Compressed: {os.path.basename(log_file)} - "
+                  f"{format_size(st.st_size)} -> {format_size(new_size)}{Style.RESET_ALL}")
+        except Exception as e:
+            if os.path.exists(tmp_target):
+                os.remove(tmp_target)
+            failed += 1
+            print_status(f"{ERROR}Error compressing {os.path.basename(log_file)}: {e}{Style.RESET_ALL}")
+    
+    if compressed:
+        print(f"{SUCCESS}Compressed {compressed} log files, saved {format_size(saved)}.{Style.RESET_ALL}")
+    elif not failed:
+        print(f"{INFO}No log files were old enough to compress.{Style.RESET_ALL}")
+
+def index_logs():
+    """Build or extend the sidecar index for every log file"""
+    log_files = sorted(glob.glob(os.path.join(ensure_logs_dir(), "*.log")), reverse=True)
+    
+    if not log_files:
+        print_status(f"{WARNING}No log files found.{Style.RESET_ALL}")
+        return
+    
+    print(f"\n{HEADER}Indexing Log Files:{Style.RESET_ALL}")
+    for log_file in log_files:
+        try:
+            meta = update_index(log_file)["meta"]
+            counts = meta["counts"]
+            print(f"{INFO}{os.path.basename(log_file)}{Style.RESET_ALL} - "
+                  f"{DESCRIPTION}{meta['lines']:,} lines, "
+                  f"{LOG_ERROR}{counts['ERROR']:,} errors{DESCRIPTION}, "
+                  f"{LOG_WARNING}{counts['WARNING']:,} warnings{Style.RESET_ALL}")
+            if meta["first_timestamp"]:
+                print(f"  {LOG_TIMESTAMP}{meta['first_timestamp']} - {meta['last_timestamp']}{Style.RESET_ALL}")
+        except Exception as e:
+            print_status(f"{ERROR}Error indexing {os.path.basename(log_file)}: {e}{Style.RESET_ALL}")
+
+# inotify event masks (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+def open_inotify(path):
+    """Watch a directory with inotify, returning the fd or None if unavailable"""
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        # Not Linux, or libc without inotify
+        return None
+
+def wait_for_change(inotify_fd, timeout):
+    """Block until the watched directory changes or the timeout expires"""
+    if inotify_fd is None:
+        time.sleep(timeout)
+        return
+    
+    readable, _, _ = select.select([inotify_fd], [], [], timeout)
+    if readable:
+        # Drain queued events; we re-check the file state ourselves
+        try:
+            while os.read(inotify_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+def follow_log(log_file, initial_lines=10, poll_interval=1.0):
+    """Print new lines appended to a log file until interrupted"""
+    if is_compressed(log_file):
+        print_status(f"{ERROR}Cannot follow a compressed log file.{Style.RESET_ALL}")
+        return
+    
+    inotify_fd = open_inotify(os.path.dirname(os.path.abspath(log_file)))
+    f = None
+    
+    try:
+        # Fix the starting offset before showing the tail, so lines appended
+        # while the tail is printed are picked up by the follow loop
+        f = open(log_file, 'rb')
+        offset = os.fstat(f.fileno()).st_size
+        if initial_lines:
+            tail = tail_lines(log_file, initial_lines, f=f, end=offset)
+            render_with_header(f"Log File: {os.path.basename(log_file)}", format_lines(tail, log_file))
+        
+        f.seek(offset)
+        pending = b""
+        
+        mode = "inotify" if inotify_fd is not None else "polling"
+        print_status(f"{INFO}Following {os.path.basename(log_file)} ({mode}). Press Ctrl+C to stop.{Style.RESET_ALL}")
+        
+        while True:
+            chunk = f.read()
+            if chunk:
+                pending += chunk
+                complete, _, pending = pending.rpartition(b"\n")
+                if complete:
+                    text = complete.decode('utf-8', errors='replace').split("\n")
+                    render(format_lines(text, log_file))
+                continue
+            
+            # Nothing new: check for truncation or rotation before sleeping
+            try:
+                path_stat = os.stat(log_file)
+            except FileNotFoundError:
+                path_stat = None
+            open_stat = os.fstat(f.fileno())
+            
+            if path_stat and (path_stat.st_ino, path_stat.st_dev) != (open_stat.st_ino, open_stat.st_dev):
+                # Rotated: the old file is fully drained, switch to the new one
+                print_status(f"{WARNING}Log file rotated, reopening.{Style.RESET_ALL}")
+                f.close()
+                f = open(log_file, 'rb')
+                pending = b""
+                continue
+            
+            if open_stat.st_size < f.tell():
+                print_status(f"{WARNING}Log file truncated, reading from start.{Style.RESET_ALL}")
+                f.seek(0)
+                pending = b""
+                continue
+            
+            wait_for_change(inotify_fd, poll_interval)
+            
+    except KeyboardInterrupt:
+        print()
+    except Exception as e:
+        print_status(f"{ERROR}Error following log file: {e}{Style.RESET_ALL}")
+    finally:
+        if f:
+            f.close()
+        if inotify_fd is not None:
+            os.close(inotify_fd)
+
+def delete_log(log_file, quiet=False):
     """Delete a log file"""
     try:
         os.remove(log_file)
-        print(f"{SUCCESS}Log file deleted: {os.path.basename(log_file)}{Style.RESET_ALL}")
+        index_path = get_index_path(log_file)
+        for suffix in INDEX_SUFFIXES:
+            if os.path.exists(index_path + suffix):
+                os.remove(index_path + suffix)
+        if not quiet:
+            print(f"{SUCCESS}Log file deleted: {os.path.basename(log_file)}{Style.RESET_ALL}")
         return True
     except Exception as e:
-        print(f"{ERROR}Error deleting log file: {e}{Style.RESET_ALL}")
+        print_status(f"{ERROR}Error deleting log file: {e}{Style.RESET_ALL}")
         return False
 
 def clear_all_logs():
     """Delete all log files"""
     logs_dir = ensure_logs_dir()
-    log_files = glob.glob(os.path.join(logs_dir, "*.log"))
+    log_files = find_log_files(logs_dir)
     
     if not log_files:
-        print(f"{WARNING}No log files to clear.{Style.RESET_ALL}")
+        print_status(f"{WARNING}No log files to clear.{Style.RESET_ALL}")
         return
         
-    print(f"{WARNING}About to delete {len(log_files)} log files.{Style.RESET_ALL}")
+    print_status(f"{WARNING}About to delete {len(log_files)} log files.{Style.RESET_ALL}")
     confirm = input(f"{WARNING}Are you sure? (y/N): {Style.RESET_ALL}")
     
     if confirm.lower() != 'y':
@@ -159,14 +1183,34 @@ def show_help():
     print(f"{COMMAND}  sigma.viewlogs <n> <lines>{DESCRIPTION} - View last N lines of log file")
     print(f"{COMMAND}  sigma.viewlogs <n> filter <text>{DESCRIPTION} - Filter log by text")
     print(f"{COMMAND}  sigma.viewlogs <n> errors{DESCRIPTION} - Show only errors in log")
+    print(f"{COMMAND}  sigma.viewlogs <n> since <ts> [until <ts>]{DESCRIPTION} - Show entries in a time range")
+    print(f"{COMMAND}  sigma.viewlogs <n> follow{DESCRIPTION} - Follow log as new lines are written")
+    print(f"{COMMAND}  sigma.viewlogs <n> page <p> [size]{DESCRIPTION} - View a page of the log (default: 100 lines)")
+    print(f"{COMMAND}  sigma.viewlogs search <regex> [max]{DESCRIPTION} - Search all log files (default: 500 matches)")
+    print(f"{COMMAND}  sigma.viewlogs compress <days> [fmt]{DESCRIPTION} - Compress logs older than X days (gz, bz2, xz, zst)")
+    print(f"{COMMAND}  sigma.viewlogs stats [n] [hour|minute]{DESCRIPTION} - Show level counts, error rates and top messages")
+    print(f"{COMMAND}  sigma.viewlogs index{DESCRIPTION} - Build or update log indexes")
     print(f"{COMMAND}  sigma.viewlogs delete <n>{DESCRIPTION} - Delete log file by number")
     print(f"{COMMAND}  sigma.viewlogs clear{DESCRIPTION} - Delete all log files")
+    print(f"{COMMAND}  --no-color, --raw{DESCRIPTION} - Plain output without colors (default when piped)")
+    print(f"{COMMAND}  --json, --ndjson{DESCRIPTION} - One JSON record per log line")
     print()
 
 def main():
     """Main entry point for the viewlogs module"""
+    global COLOR_OUTPUT, JSON_OUTPUT
     args = sys.argv[1:] if len(sys.argv) > 1 else []
     
+    if "--json" in args or "--ndjson" in args:
+        JSON_OUTPUT = True
+        COLOR_OUTPUT = False
+        args = [arg for arg in args if arg not in ("--json", "--ndjson")]
+    
+    # Raw output skips escape codes and colorama entirely
+    if "--no-color" in args or "--raw" in args:
+        COLOR_OUTPUT = False
+        args = [arg for arg in args if arg not in ("--no-color", "--raw")]
+    
     if not args:
         log_files = list_logs()
         if log_files:
@@ -183,23 +1227,72 @@ def main():
         clear_all_logs()
         return
         
+    if command == "search" and len(args) >= 2:
+        try:
+            max_results = int(args[2]) if len(args) >= 3 else 500
+        except ValueError:
+            print_status(f"{ERROR}Invalid number of results: {args[2]}{Style.RESET_ALL}")
+            return
+        search_logs(args[1], max_results)
+        return
+        
+    if command == "index":
+        index_logs()
+        return
+        
+    if command == "stats":
+        log_files = find_log_files()
+        bucket = "hour"
+        for arg in args[1:]:
+            if arg.lower() in STATS_BUCKETS:
+                bucket = arg.lower()
+                continue
+            try:
+                index = int(arg) - 1
+            except ValueError:
+                print_status(f"{ERROR}Invalid argument: {arg}{Style.RESET_ALL}")
+                return
+            if not 0 <= index < len(log_files):
+                print_status(f"{ERROR}Invalid log file number.{Style.RESET_ALL}")
+                return
+            log_files = [log_files[index]]
+        
+        if not log_files:
+            print_status(f"{WARNING}No log files found.{Style.RESET_ALL}")
+            return
+        show_stats(log_files, bucket)
+        return
+        
+    if command == "compress" and len(args) >= 2:
+        try:
+            days = float(args[1])
+        except ValueError:
+            print_status(f"{ERROR}Invalid number of days: {args[1]}{Style.RESET_ALL}")
+            return
+        fmt = args[2].lower() if len(args) >= 3 else "gz"
+        if fmt not in ("gz", "bz2", "xz", "zst"):
+            print_status(f"{ERROR}Invalid format: {fmt} (use gz, bz2, xz or zst){Style.RESET_ALL}")
+            return
+        compress_logs(days, fmt)
+        return
+        
     if command == "delete" and len(args) == 2:
         try:
             index = int(args[1]) - 1
-            log_files = sorted(glob.glob(os.path.join(get_logs_dir(), "*.log")), reverse=True)
+            log_files = find_log_files()
             if 0 <= index < len(log_files):
                 delete_log(log_files[index])
             else:
-                print(f"{ERROR}Invalid log file number.{Style.RESET_ALL}")
+                print_status(f"{ERROR}Invalid log file number.{Style.RESET_ALL}")
         except ValueError:
-            print(f"{ERROR}Invalid log file number.{Style.RESET_ALL}")
+            print_status(f"{ERROR}Invalid log file number.{Style.RESET_ALL}")
         return
     
     # Handle viewing logs
     try:
         # Try to parse first argument as a number
         index = int(command) - 1
-        log_files = sorted(glob.glob(os.path.join(get_logs_dir(), "*.log")), reverse=True)
+        log_files = find_log_files()
         
         if 0 <= index < len(log_files):
             log_file = log_files[index]
@@ -213,6 +1306,29 @@ def main():
                 elif args[1] == "errors":
                     # Show only errors
                     view_log(log_file, show_errors_only=True)
+                elif args[1] in ("since", "until") and len(args) >= 3:
+                    # Time range; timestamps may span several arguments
+                    bounds = {"since": [], "until": []}
+                    current = None
+                    for arg in args[1:]:
+                        if arg in bounds:
+                            current = arg
+                        elif current:
+                            bounds[current].append(arg)
+                    view_time_range(log_file,
+                                    " ".join(bounds["since"]) or None,
+                                    " ".join(bounds["until"]) or None)
+                elif args[1] == "follow":
+                    # Watch for new lines
+                    follow_log(log_file)
+                elif args[1] == "page" and len(args) >= 3:
+                    # Jump to a page via the line index
+                    try:
+                        page = int(args[2])
+                        page_size = int(args[3]) if len(args) >= 4 else 100
+                        view_page(log_file, page, page_size)
+                    except ValueError:
+                        print_status(f"{ERROR}Invalid page number.{Style.RESET_ALL}")
                 else:
                     try:
                         # Try to parse as number of lines
@@ -223,16 +1339,16 @@ def main():
             else:
                 view_log(log_file)
         else:
-            print(f"{ERROR}Invalid log file number.{Style.RESET_ALL}")
+            print_status(f"{ERROR}Invalid log file number.{Style.RESET_ALL}")
     except ValueError:
         # First argument is not a number, try as filename
         logs_dir = get_logs_dir()
-        log_file = os.path.join(logs_dir, command if command.endswith(".log") else command + ".log")
+        log_file = os.path.join(logs_dir, command if command.endswith(LOG_EXTENSIONS) else command + ".log")
         
         if os.path.exists(log_file):
             view_log(log_file)
         else:
-            print(f"{ERROR}Log file not found: {command}{Style.RESET_ALL}")
+            print_status(f"{ERROR}Log file not found: {command}{Style.RESET_ALL}")
             list_logs()
 
 if __name__ == "__main__":